@@ -0,0 +1,91 @@
+## Response Compression By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import zlib
+
+###########################################
+
+## Streaming encoders - each chunk is compressed and flushed at a block boundary, so a client ##
+## can decode every batch as it arrives instead of waiting for the whole response ##
+
+class GzipEncoder:
+    def __init__(self, level):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  ## wbits 31 writes the gzip header and trailer ##
+
+    def compress(self, chunk):
+        return self.compressor.compress(chunk) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self.compressor.flush()
+
+class ZstdEncoder:
+    def __init__(self, level):
+        import zstandard
+        self.flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk):
+        return self.compressor.compress(chunk) + self.compressor.flush(self.flush_block)
+
+    def finish(self):
+        return self.compressor.flush()
+
+## Content-Encoding -> (encoder class, default level, optional module it needs) ##
+ENCODINGS = {
+    "zstd": (ZstdEncoder, 3, "zstandard"),
+    "gzip": (GzipEncoder, 6, None),
+}
+
+## Encodings from names (in server preference order) whose optional package, if any, is installed ##
+def available_encodings(names):
+    available = []
+    for name in names:
+        if name not in ENCODINGS:
+            raise ValueError(f"Unknown content encoding: {name}")
+        module = ENCODINGS[name][2]
+        if module is not None:
+            try:
+                __import__(module)
+            except ImportError:
+                continue
+        available.append(name)
+    return available
+
+def make_encoder(encoding, level=None):
+    encoder_class, default_level, _ = ENCODINGS[encoding]
+    return encoder_class(default_level if level is None else level)
+
+## Compress a stream of byte chunks incrementally ##
+def compress_stream(chunks, encoding, level=None):
+    encoder = make_encoder(encoding, level)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = encoder.compress(chunk)
+        if data:
+            yield data
+    yield encoder.finish()
+
+## Compress a complete body in one call ##
+def compress_body(body, encoding, level=None):
+    encoder = make_encoder(encoding, level)
+    return encoder.compress(body) + encoder.finish()
+
+## Pull chunks until at least min_bytes are buffered or the stream ends ##
+## Returns (buffered chunks, rest of the stream, True if the stream ended first) ##
+def peek_stream(chunks, min_bytes):
+    chunks = iter(chunks)
+    head = []
+    size = 0
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        head.append(chunk)
+        size += len(chunk)
+        if size >= min_bytes:
+            return head, chunks, False
+    return head, chunks, True
+
+def chain_chunks(head, rest):
+    yield from head
+    yield from rest
@@ -1,12 +1,18 @@
 import argparse
 import json
 import random
+import queue
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timezone
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from JsonSerializer import dumps, dumps_lines
 
 FIXED_FIELDS: Dict[str, str] = {
     "Customer Name": "full_name",
@@ -44,11 +50,33 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--es-index", default="elasticshipper")
     p.add_argument("--es-bulk-size", type=int, default=1000)
     p.add_argument("--es-api-key", default="X1ZpVzY1Z0JETXhrZXBLODRpU2c6eDRQRzNiRjNBWlVkaVZwVXNQV3l2dw==")
+    p.add_argument("--es-concurrency", type=int, default=4, help="bulk requests kept in flight")
+    p.add_argument("--stream", action="store_true", help="stream NDJSON from the API straight into _bulk")
+    p.add_argument("--es-min-bulk-size", type=int, default=100, help="lower bound for the adaptive chunk size")
+    p.add_argument("--es-max-bulk-size", type=int, default=5000, help="upper bound for the adaptive chunk size")
+    p.add_argument("--es-target-latency", type=float, default=1.0, help="seconds per _bulk request the chunk size adapts towards")
+    p.add_argument("--es-max-retries", type=int, default=5)
+    p.add_argument("--es-backoff", type=float, default=0.5, help="base seconds for exponential retry backoff")
+    p.add_argument("--in-process", action="store_true", help="generate records with RandomDataGenerator instead of calling the API")
+    p.add_argument("--target-rate", type=float, default=0, help="continuous mode: docs/sec to produce, paced by a token bucket")
+    p.add_argument("--producers", type=int, default=1, help="--target-rate: producer threads (they share one core for in-process generation)")
+    p.add_argument("--producer-processes", type=int, default=1, help="--target-rate --in-process: generate in this many worker processes to use more than one core")
+    p.add_argument("--report-interval", type=float, default=10.0, help="--target-rate: seconds between rate reports")
+    p.add_argument("--value-pool-size", type=int, default=0, help="--in-process: serve expensive Faker types from pre-generated pools of this size")
+    p.add_argument("--es-bulk-bytes", type=int, default=5 * 1024 * 1024, help="initial flush size for bodies built from API NDJSON (--stream, or --target-rate without --in-process)")
     return p
 
-def post_schema(api_base: str, schema: Dict[str, Any], timeout: int) -> None:
+def make_session(pool_size: int) -> requests.Session:
+    # Keep-alive connection pool so every call doesn't open a new TCP connection
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+def post_schema(session: requests.Session, api_base: str, schema: Dict[str, Any], timeout: int) -> None:
     try:
-        r = requests.post(f"{api_base}/schemas", json=schema, timeout=timeout)
+        r = session.post(f"{api_base}/schemas", json=schema, timeout=timeout)
         if r.status_code >= 400:
             print(f"[schema] {r.status_code}: {r.text[:200]}")
         else:
@@ -56,20 +84,20 @@ def post_schema(api_base: str, schema: Dict[str, Any], timeout: int) -> None:
     except Exception as e:
         print(f"[schema] {e}")
 
-def fetch_data(api_base: str, schema_name: str, timeout: int):
+def fetch_data(session: requests.Session, api_base: str, schema_name: str, timeout: int):
     try:
-        r = requests.get(f"{api_base}/schemas/{schema_name}/data", timeout=timeout)
+        r = session.get(f"{api_base}/schemas/{schema_name}/data", timeout=timeout)
         return r.json() if r.status_code < 400 else f"[data] {r.status_code}: {r.text[:200]}"
     except Exception as e:
         return f"[data] {e}"
 
-def ensure_index(es_url: str, index: str, timeout: int, headers: Dict[str, str]) -> None:
+def ensure_index(session: requests.Session, es_url: str, index: str, timeout: int, headers: Dict[str, str]) -> None:
     try:
-        h = requests.head(f"{es_url}/{index}", timeout=timeout, headers=headers)
+        h = session.head(f"{es_url}/{index}", timeout=timeout, headers=headers)
         if h.status_code == 200:
             return
         if h.status_code == 404:
-            r = requests.put(f"{es_url}/{index}", json={}, timeout=timeout, headers=headers)
+            r = session.put(f"{es_url}/{index}", json={}, timeout=timeout, headers=headers)
             if r.status_code < 400:
                 print(f"[es] created index {index}")
             else:
@@ -79,39 +107,357 @@ def ensure_index(es_url: str, index: str, timeout: int, headers: Dict[str, str])
     except Exception as e:
         print(f"[es] ensure_index {e}")
 
-def _ndjson(actions: List[Dict[str, Any]], docs: List[Dict[str, Any]]) -> str:
-    lines = []
-    for a, d in zip(actions, docs):
-        lines.append(json.dumps(a))
-        lines.append(json.dumps(d))
-    return "\n".join(lines) + "\n"
+def _ndjson(actions: List[Dict[str, Any]], docs: List[Dict[str, Any]]) -> bytes:
+    return dumps_lines(line for pair in zip(actions, docs) for line in pair)
 
-def bulk_index(es_url: str, index: str, docs: List[Dict[str, Any]], timeout: int, bulk_size: int, headers: Dict[str, str]) -> None:
-    if not docs:
-        return
-    url = f"{es_url}/_bulk"
-    hdrs = {"Content-Type": "application/x-ndjson", **headers}
-    i = 0
-    total = 0
-    while i < len(docs):
-        chunk = docs[i:i+bulk_size]
-        actions = [{"index": {"_index": index}} for _ in chunk]
-        body = _ndjson(actions, chunk)
-        try:
-            r = requests.post(url, data=body, headers=hdrs, timeout=max(timeout, 10))
-            if r.status_code == 401:
-                print("[es] 401 Unauthorized")
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+class BatchSizer:
+    # Adapts the _bulk chunk size (docs, or bytes when bodies come from API NDJSON) within [minimum, maximum]:
+    # halve on rejections, shrink when ES is slower than target_latency, grow when it is well under it
+    def __init__(self, initial: int, minimum: int, maximum: int, target_latency: float):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.size = min(max(initial, self.minimum), self.maximum)
+        self.target_latency = target_latency
+        self.lock = threading.Lock()
+
+    def record(self, latency: float, rejected: bool) -> None:
+        with self.lock:
+            if rejected:
+                size = self.size // 2
+            elif latency > self.target_latency:
+                size = int(self.size * 0.8)
+            elif latency < self.target_latency / 2:
+                size = int(self.size * 1.25) + 1
+            else:
                 return
+            self.size = min(max(size, self.minimum), self.maximum)
+
+class BulkSender:
+    # Posts _bulk bodies with up to `concurrency` in flight. Failed items are re-queued on their own
+    # with exponential backoff and jitter; whole-request 429/5xx/network errors retry the body.
+    def __init__(self, session: requests.Session, es_url: str, headers: Dict[str, str], timeout: int,
+                 executor: Optional[ThreadPoolExecutor] = None, concurrency: int = 1, sizer: Optional[BatchSizer] = None,
+                 max_retries: int = 5, backoff: float = 0.5, max_backoff: float = 30.0):
+        self.session = session
+        self.url = f"{es_url}/_bulk"
+        self.hdrs = {"Content-Type": "application/x-ndjson", **headers}
+        self.timeout = max(timeout, 10)
+        self.executor = executor
+        self.concurrency = concurrency
+        self.sizer = sizer
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.lifetime = {"indexed": 0, "retried": 0, "dropped": 0}  # across all send() calls, for rate reports
+        self.lifetime_lock = threading.Lock()
+
+    def _sleep(self, attempt: int) -> None:
+        delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+        time.sleep(random.uniform(0, delay))  # full jitter
+
+    def _record(self, started: float, rejected: bool) -> None:
+        if self.sizer:
+            self.sizer.record(time.monotonic() - started, rejected)
+
+    def _post(self, body: Any) -> Dict[str, Any]:
+        stats = self._post_with_retries(body)
+        with self.lifetime_lock:
+            for k in self.lifetime:
+                self.lifetime[k] += stats[k]
+        return stats
+
+    def _post_with_retries(self, body: Any) -> Dict[str, Any]:
+        # Returns counters for one body, including every retry of its failed items
+        stats = {"indexed": 0, "retried": 0, "dropped": 0, "error": None}
+        lines = (body.encode() if isinstance(body, str) else body).rstrip(b"\n").split(b"\n")
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._sleep(attempt - 1)
+            pairs = len(lines) // 2
+            started = time.monotonic()
+            try:
+                r = self.session.post(self.url, data=b"\n".join(lines) + b"\n", headers=self.hdrs, timeout=self.timeout)
+            except Exception as e:
+                self._record(started, True)
+                stats["error"] = f"bulk {e}"
+                stats["retried"] += pairs
+                continue
+            if r.status_code == 401:
+                stats["error"] = "401 Unauthorized"
+                stats["dropped"] += pairs
+                return stats
+            if r.status_code in RETRYABLE_STATUSES:
+                self._record(started, True)
+                stats["error"] = f"bulk {r.status_code}: {r.text[:200]}"
+                stats["retried"] += pairs
+                continue
             if r.status_code >= 400:
-                print(f"[es] bulk {r.status_code}: {r.text[:200]}")
-                return
-            resp = r.json()
-            total += len(resp.get("items", []))
-        except Exception as e:
-            print(f"[es] bulk {e}")
+                stats["error"] = f"bulk {r.status_code}: {r.text[:200]}"
+                stats["dropped"] += pairs
+                return stats
+            try:
+                resp = r.json()
+            except ValueError:
+                resp = None
+            if not isinstance(resp, dict):
+                # A 2xx that is not a _bulk reply (e.g. a proxy page) says nothing about the items: retry them
+                self._record(started, True)
+                stats["error"] = f"bulk {r.status_code}: unexpected response {r.text[:200]}"
+                stats["retried"] += pairs
+                continue
+            items = resp.get("items", [])
+            if not resp.get("errors"):
+                self._record(started, False)
+                stats["indexed"] += len(items)
+                stats["error"] = None
+                return stats
+            retry_lines: List[bytes] = []
+            for i, item in enumerate(items):
+                status = next(iter(item.values()), {}).get("status", 500)
+                if status < 300:
+                    stats["indexed"] += 1
+                elif status in RETRYABLE_STATUSES or status >= 500:
+                    retry_lines.extend(lines[2 * i:2 * i + 2])
+                else:
+                    stats["dropped"] += 1
+            self._record(started, bool(retry_lines))
+            if not retry_lines:
+                return stats
+            stats["retried"] += len(retry_lines) // 2
+            lines = retry_lines
+        # Out of retries: whatever is still queued is lost
+        stats["retried"] -= len(lines) // 2
+        stats["dropped"] += len(lines) // 2
+        return stats
+
+    def send(self, bodies: Iterable[Any]) -> Dict[str, Any]:
+        totals = {"indexed": 0, "retried": 0, "dropped": 0, "error": None}
+        in_flight = set()
+
+        def collect(results) -> None:
+            for stats in results:
+                for k in ("indexed", "retried", "dropped"):
+                    totals[k] += stats[k]
+                if stats["error"] and not totals["error"]:
+                    totals["error"] = stats["error"]
+
+        for body in bodies:
+            if totals["error"] == "401 Unauthorized":
+                break
+            if self.executor is None:
+                collect([self._post(body)])
+                continue
+            # Backpressure: at most `concurrency` bulk requests in flight
+            if len(in_flight) >= self.concurrency:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(f.result() for f in done)
+            in_flight.add(self.executor.submit(self._post, body))
+        if in_flight:
+            done, _ = wait(in_flight)
+            collect(f.result() for f in done)
+        if totals["error"]:
+            print(f"[es] last error: {totals['error']}")
+        size = f" | next chunk {self.sizer.size}" if self.sizer else ""
+        print(f"[es] indexed {totals['indexed']} | retried {totals['retried']} | dropped {totals['dropped']}{size}")
+        return totals
+
+def _chunk_size(sizer: Optional[BatchSizer], default: int) -> int:
+    return sizer.size if sizer else default
+
+def bulk_index(sender: BulkSender, index: str, docs: List[Dict[str, Any]], bulk_size: int) -> Dict[str, Any]:
+    if not docs:
+        return {}
+
+    def bodies() -> Iterator[bytes]:
+        i = 0
+        while i < len(docs):
+            n = _chunk_size(sender.sizer, bulk_size)
+            chunk = docs[i:i+n]
+            actions = [{"index": {"_index": index}} for _ in chunk]
+            yield _ndjson(actions, chunk)
+            i += n
+
+    return sender.send(bodies())
+
+def stream_data(session: requests.Session, api_base: str, schema_name: str, timeout: int, count: Optional[int] = None) -> Iterator[bytes]:
+    # Yields raw NDJSON lines as they arrive instead of parsing the whole payload
+    params = {"count": count} if count else None
+    with session.get(f"{api_base}/schemas/{schema_name}/data", params=params, headers={"Accept": "application/x-ndjson"}, timeout=timeout, stream=True) as r:
+        if r.status_code >= 400:
+            print(f"[data] {r.status_code}: {r.text[:200]}")
             return
-        i += bulk_size
-    print(f"[es] indexed {total}")
+        for line in r.iter_lines(chunk_size=64 * 1024):
+            if line:
+                yield line
+
+def stream_bulk_bodies(lines: Iterable[bytes], index: str, ingested_at: str, max_bytes: int, sizer: Optional[BatchSizer] = None) -> Iterator[bytes]:
+    # Builds _bulk bodies at the byte level: each doc line gets @ingested_at spliced in
+    # before its closing brace, and bodies are flushed once they reach max_bytes
+    action = dumps({"index": {"_index": index}}) + b"\n"
+    field = b'"@ingested_at":' + dumps(ingested_at)
+    parts: List[bytes] = []
+    size = 0
+    for line in lines:
+        line = line.rstrip()
+        if not line.startswith(b"{") or not line.endswith(b"}"):
+            continue
+        inner = line[1:-1].strip()
+        doc = b"{" + (inner + b"," if inner else b"") + field + b"}\n"
+        parts.append(action)
+        parts.append(doc)
+        size += len(action) + len(doc)
+        if size >= _chunk_size(sizer, max_bytes):
+            yield b"".join(parts)
+            parts = []
+            size = 0
+    if parts:
+        yield b"".join(parts)
+
+def generated_bulk_bodies(records: Iterable[Dict[str, Any]], index: str, ingested_at: str, bulk_size: int, sizer: Optional[BatchSizer] = None) -> Iterator[bytes]:
+    # Records come fresh from the generator, so @ingested_at is set in place without a copy
+    action = dumps({"index": {"_index": index}})
+    lines: List[bytes] = []
+    for d in records:
+        d["@ingested_at"] = ingested_at
+        lines.append(action)
+        lines.append(dumps(d))
+        if len(lines) >= 2 * _chunk_size(sizer, bulk_size):
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+def ship_in_process(plan: Any, count: int, sender: BulkSender, args: argparse.Namespace) -> None:
+    from RandomDataGenerator import iter_data
+    now = datetime.now(timezone.utc).isoformat()
+    print(f"[es] generating {count} in-process")
+    bodies = generated_bulk_bodies(iter_data(plan, count), args.es_index, now, args.es_bulk_size, sender.sizer)
+    sender.send(bodies)
+
+def ship_stream(api_session: requests.Session, sender: BulkSender, args: argparse.Namespace) -> None:
+    now = datetime.now(timezone.utc).isoformat()
+    try:
+        lines = stream_data(api_session, args.api_base, args.schema_name, args.timeout)
+        sender.send(stream_bulk_bodies(lines, args.es_index, now, args.es_bulk_bytes, sender.sizer))
+    except Exception as e:
+        print(f"[data] {e}")
+
+class TokenBucket:
+    # Hands out `rate` tokens per second, holding at most `capacity` so idle time can't build a big burst
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self, n: int, stop: threading.Event) -> bool:
+        # Blocks until n tokens are available; returns False if stop is set first
+        while not stop.is_set():
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return True
+                delay = (n - self.tokens) / self.rate
+            stop.wait(delay)
+        return False
+
+def run_target_rate(args: argparse.Namespace, api_session: requests.Session, sender: BulkSender, plan: Any) -> None:
+    # Producers generate one batch per token grant and queue ready _bulk bodies; the sender drains the
+    # queue concurrently, so generation and indexing overlap. A full queue blocks producers (backpressure).
+    rate = args.target_rate
+    batch = max(1, min(args.es_bulk_size, int(rate)))
+    bucket = TokenBucket(rate, max(batch, rate))
+    bodies: "queue.Queue[bytes]" = queue.Queue(maxsize=max(2, args.producers * 2))
+    stop = threading.Event()
+    produced = [0]
+    lock = threading.Lock()
+
+    if plan is None:
+        post_schema(api_session, args.api_base, {"name": args.schema_name, "count": batch, "fields": FIXED_FIELDS}, args.timeout)
+
+    def generate_records(count: int) -> Iterable[Dict[str, Any]]:
+        from RandomDataGenerator import iter_data, generate_chunk, get_process_pool, get_plan_fields, columns_to_records
+        if args.producer_processes <= 1:
+            return iter_data(plan, count)
+        # Faker holds the GIL, so generation runs in worker processes and threads only build bodies
+        future = get_process_pool(args.producer_processes).submit(generate_chunk, get_plan_fields(plan), count, random.getrandbits(63), 0)
+        batches, _ = future.result()
+        return (record for size, columns in batches for record in columns_to_records(columns, size, plan.keys))
+
+    def make_bodies() -> List[bytes]:
+        # Each token grant of `batch` docs is split into bodies of the sizer's current chunk size
+        now = datetime.now(timezone.utc).isoformat()
+        if plan is not None:
+            return list(generated_bulk_bodies(generate_records(batch), args.es_index, now, batch, sender.sizer))
+        lines = stream_data(api_session, args.api_base, args.schema_name, args.timeout, count=batch)
+        return list(stream_bulk_bodies(lines, args.es_index, now, args.es_bulk_bytes, sender.sizer))
+
+    def produce() -> None:
+        while bucket.take(batch, stop):
+            try:
+                ready = make_bodies()
+            except Exception as e:
+                print(f"[producer] {e}")
+                continue
+            for body in ready:
+                while not stop.is_set():
+                    try:
+                        bodies.put(body, timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+                with lock:
+                    produced[0] += body.count(b"\n") // 2
+
+    def drain() -> Iterator[bytes]:
+        while not stop.is_set() or not bodies.empty():
+            try:
+                yield bodies.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    # With worker processes, keep at least one producer thread per process so every core stays busy
+    producer_count = max(1, args.producers, args.producer_processes if plan is not None else 1)
+    producers = [threading.Thread(target=produce, daemon=True) for _ in range(producer_count)]
+    consumer = threading.Thread(target=sender.send, args=(drain(),), daemon=True)
+    for t in producers:
+        t.start()
+    consumer.start()
+
+    started = time.monotonic()
+    last_time, last_produced, last_indexed = started, 0, 0
+    try:
+        while True:
+            time.sleep(args.report_interval)
+            now = time.monotonic()
+            indexed = sender.lifetime["indexed"]
+            elapsed = now - last_time
+            print(f"[rate] target {rate:.0f}/s | produced {(produced[0] - last_produced) / elapsed:.0f}/s"
+                  f" | indexed {(indexed - last_indexed) / elapsed:.0f}/s"
+                  f" | overall {indexed / (now - started):.0f}/s | queued {bodies.qsize()}")
+            last_time, last_produced, last_indexed = now, produced[0], indexed
+    finally:
+        stop.set()
+        for t in producers:
+            t.join()
+        consumer.join()
+
+def sizes_in_bytes(args: argparse.Namespace) -> bool:
+    # Bodies built from raw API NDJSON lines (--stream, and --target-rate without --in-process) are sized in bytes
+    return args.stream or (args.target_rate > 0 and not args.in_process)
+
+def make_sizer(args: argparse.Namespace) -> BatchSizer:
+    # Bounds are given in docs; byte-sized modes scale them to bytes relative to --es-bulk-bytes
+    in_bytes = sizes_in_bytes(args)
+    scale = args.es_bulk_bytes / max(1, args.es_bulk_size) if in_bytes else 1
+    initial = args.es_bulk_bytes if in_bytes else args.es_bulk_size
+    return BatchSizer(initial, int(args.es_min_bulk_size * scale), int(args.es_max_bulk_size * scale), args.es_target_latency)
 
 def main():
     args = build_parser().parse_args()
@@ -120,17 +466,46 @@ def main():
     headers = {"Authorization": f"ApiKey {args.es_api_key}"} if args.es_api_key else {}
 
     print("Starting. Ctrl+C to stop.")
-    print(f"API: {args.api_base} | interval: {args.interval}s | count: {min_c}-{max_c} | ES: {args.es_url}/{args.es_index}")
+    source = "in-process" if args.in_process else args.api_base
+    print(f"API: {source} | interval: {args.interval}s | count: {min_c}-{max_c} | ES: {args.es_url}/{args.es_index}")
+
+    concurrency = max(1, args.es_concurrency)
+    api_session = make_session(max(1, args.producers))
+    es_session = make_session(concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+    sender = BulkSender(es_session, args.es_url, headers, args.timeout, executor, concurrency, make_sizer(args),
+                        max_retries=args.es_max_retries, backoff=args.es_backoff)
+
+    ensure_index(es_session, args.es_url, args.es_index, args.timeout, headers)
 
-    ensure_index(args.es_url, args.es_index, args.timeout, headers)
+    plan = None
+    if args.in_process:
+        # Only this mode needs the generator (and Faker), so import it here
+        from RandomDataGenerator import compile_schema, enable_value_pools
+        plan = compile_schema(FIXED_FIELDS, strict=True)
+        if args.value_pool_size > 0:
+            enable_value_pools(size=args.value_pool_size)
 
     try:
+        if args.target_rate > 0:
+            run_target_rate(args, api_session, sender, plan)
+            return
         while True:
             count = random.randint(min_c, max_c)
+            if plan is not None:
+                ship_in_process(plan, count, sender, args)
+                time.sleep(args.interval)
+                continue
+
             schema = {"name": args.schema_name, "count": count, "fields": FIXED_FIELDS}
-            post_schema(args.api_base, schema, args.timeout)
+            post_schema(api_session, args.api_base, schema, args.timeout)
+
+            if args.stream:
+                ship_stream(api_session, sender, args)
+                time.sleep(args.interval)
+                continue
 
-            data = fetch_data(args.api_base, args.schema_name, args.timeout)
+            data = fetch_data(api_session, args.api_base, args.schema_name, args.timeout)
             ts = time.strftime("%Y-%m-%d %H:%M:%S")
             try:
                 preview = data[:2] if isinstance(data, list) else data
@@ -147,12 +522,15 @@ def main():
                         # no @timestamp per your request—just ship it
                         x["@ingested_at"] = now
                         docs.append(x)
-                bulk_index(args.es_url, args.es_index, docs, args.timeout, args.es_bulk_size, headers)
+                bulk_index(sender, args.es_index, docs, args.es_bulk_size)
             else:
                 print("[es] skipped: not a list")
             time.sleep(args.interval)
     except KeyboardInterrupt:
         print("\nStopped.")
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+## JSON Serializer By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import json
+import os
+
+###########################################
+
+## Every backend encodes straight to compact UTF-8 bytes so callers never round-trip through str ##
+
+def make_stdlib_backend():
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(obj):
+        return encoder.encode(obj).encode()
+
+    def dumps_lines(objs):
+        return b"".join(encoder.encode(obj).encode() + b"\n" for obj in objs)
+
+    return dumps, dumps_lines
+
+def make_orjson_backend():
+    import orjson
+    append_newline = orjson.OPT_APPEND_NEWLINE
+
+    def dumps_lines(objs):
+        return b"".join(orjson.dumps(obj, option=append_newline) for obj in objs)
+
+    return orjson.dumps, dumps_lines
+
+def make_ujson_backend():
+    import ujson
+
+    def dumps(obj):
+        return ujson.dumps(obj, ensure_ascii=False).encode()
+
+    def dumps_lines(objs):
+        return b"".join(ujson.dumps(obj, ensure_ascii=False).encode() + b"\n" for obj in objs)
+
+    return dumps, dumps_lines
+
+## Backends in order of preference - the first importable one is used unless RDG_JSON_BACKEND names another ##
+backend_factories = {
+    "orjson": make_orjson_backend,
+    "ujson": make_ujson_backend,
+    "json": make_stdlib_backend,
+}
+
+## Names of the backends that can be loaded here ##
+def available_backends():
+    names = []
+    for name, factory in backend_factories.items():
+        try:
+            factory()
+            names.append(name)
+        except ImportError:
+            continue
+    return names
+
+## Load a backend by name, returning (dumps, dumps_lines) ##
+def load_backend(name):
+    return backend_factories[name]()
+
+def select_backend():
+    requested = os.environ.get("RDG_JSON_BACKEND")
+    if requested:
+        return requested, load_backend(requested)
+    for name in backend_factories:
+        try:
+            return name, load_backend(name)
+        except ImportError:
+            continue
+
+backend_name, (dumps, dumps_lines) = select_backend()
+
+## Join already-encoded objects as the inside of a JSON array ##
+def dumps_items(objs):
+    return b",".join(map(dumps, objs))
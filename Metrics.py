@@ -0,0 +1,221 @@
+## Metrics By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import json
+import os
+import secrets
+import threading
+import time
+
+###########################################
+
+## Every metric is stored as a flat {sample: value} dict of monotonic counters, where a sample is the ##
+## Prometheus series name with its labels, e.g. rdg_records_served_total{endpoint="/schemas/<name>/data"} ##
+## Counters from different workers are merged by summing samples, so aggregation needs no coordination ##
+
+## Request latency histogram buckets in seconds ##
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+## Metric family -> (type, help) ##
+METRIC_FAMILIES = {
+    "rdg_http_requests_total": ("counter", "HTTP requests handled, by endpoint, method and status."),
+    "rdg_http_request_duration_seconds": ("histogram", "Time from request start until the response body finished streaming."),
+    "rdg_records_served_total": ("counter", "Records returned in data responses."),
+    "rdg_response_bytes_total": ("counter", "Response body bytes sent, by endpoint."),
+    "rdg_generation_calls_total": ("counter", "Column batches generated, by data type."),
+    "rdg_generation_values_total": ("counter", "Values generated, by data type."),
+    "rdg_generation_seconds_total": ("counter", "Time spent generating values, by data type."),
+    "rdg_schemas": ("gauge", "Schemas currently stored."),
+}
+
+def format_labels(**labels):
+    return ",".join(f'{key}="{value}"' for key, value in labels.items())
+
+## Order samples by series, with histogram buckets in ascending le order ##
+def sample_sort_key(item):
+    sample = item[0]
+    if ',le="' not in sample:
+        return sample, 0.0
+    series, bound = sample.rsplit(',le="', 1)
+    return series, float(bound.rstrip('"}').replace("+Inf", "inf"))
+
+def format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+## Per-process counters; with a directory each worker also flushes them to its own file for /metrics to sum ##
+## collect_generation returns {dtype: [calls, values, seconds]} (RandomDataGenerator.get_generation_timings) ##
+class MetricsRegistry:
+    def __init__(self, collect_generation, directory=None, flush_interval=1.0):
+        self.collect_generation = collect_generation
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.samples = {}
+        self.lock = threading.Lock()
+        self.last_flush = 0.0
+        self.process_token = None  ## (pid, token) - the token is redrawn in each forked child ##
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def inc(self, sample, amount=1):
+        with self.lock:
+            self.samples[sample] = self.samples.get(sample, 0) + amount
+
+    def observe_request(self, endpoint, method, status, seconds):
+        labels = format_labels(endpoint=endpoint)
+        with self.lock:
+            samples = self.samples
+            key = f"rdg_http_requests_total{{{format_labels(endpoint=endpoint, method=method, status=status)}}}"
+            samples[key] = samples.get(key, 0) + 1
+            for bound in LATENCY_BUCKETS:
+                if seconds <= bound:
+                    key = f'rdg_http_request_duration_seconds_bucket{{{labels},le="{bound}"}}'
+                    samples[key] = samples.get(key, 0) + 1
+            for key, amount in (
+                (f'rdg_http_request_duration_seconds_bucket{{{labels},le="+Inf"}}', 1),
+                (f"rdg_http_request_duration_seconds_sum{{{labels}}}", seconds),
+                (f"rdg_http_request_duration_seconds_count{{{labels}}}", 1),
+            ):
+                samples[key] = samples.get(key, 0) + amount
+        self.maybe_flush()
+
+    def add_records(self, endpoint, records):
+        self.inc(f"rdg_records_served_total{{{format_labels(endpoint=endpoint)}}}", records)
+
+    def add_bytes(self, endpoint, size):
+        self.inc(f"rdg_response_bytes_total{{{format_labels(endpoint=endpoint)}}}", size)
+
+    ## Pass a streamed body through, counting bytes as they are sent ##
+    def count_bytes(self, endpoint, chunks):
+        size = 0
+        try:
+            for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+        finally:
+            self.add_bytes(endpoint, size)
+
+    ## This process's counters including generation timings ##
+    def snapshot(self):
+        with self.lock:
+            samples = dict(self.samples)
+        for dtype, (calls, values, seconds) in self.collect_generation().items():
+            labels = format_labels(data_type=dtype)
+            samples[f"rdg_generation_calls_total{{{labels}}}"] = calls
+            samples[f"rdg_generation_values_total{{{labels}}}"] = values
+            samples[f"rdg_generation_seconds_total{{{labels}}}"] = seconds
+        return samples
+
+    ## Files are keyed by pid plus a random token drawn once per process, so a recycled worker that reuses ##
+    ## a dead worker's pid writes a new file instead of overwriting (and shrinking) the dead worker's totals ##
+    def path_for(self, pid):
+        if self.process_token is None or self.process_token[0] != pid:
+            self.process_token = (pid, secrets.token_hex(8))
+        return os.path.join(self.directory, f"metrics_{pid}_{self.process_token[1]}.json")
+
+    ## Write this worker's counters at most once per flush_interval ##
+    def maybe_flush(self, force=False):
+        if not self.directory:
+            return
+        now = time.monotonic()
+        if not force and now - self.last_flush < self.flush_interval:
+            return
+        self.last_flush = now
+        write_samples(self.path_for(os.getpid()), self.snapshot())
+
+    ## Add the files of exited workers into one exited-workers file and delete them, so their counts still ##
+    ## happened but the directory (and the cost of every scrape) does not grow with each recycled worker ##
+    ## Liveness is checked by pid, so RDG_METRICS_DIR must belong to one host (one pid namespace) ##
+    def fold_exited(self):
+        import fcntl  ## POSIX only, like the gunicorn workers this is for ##
+        with open(os.path.join(self.directory, "metrics.lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)  ## One folder at a time, or two scrapes could count a file twice ##
+            exited = []
+            for filename in os.listdir(self.directory):
+                pid = worker_file_pid(filename)
+                if pid is not None and not process_alive(pid):
+                    exited.append(os.path.join(self.directory, filename))
+            if not exited:
+                return
+            exited_path = os.path.join(self.directory, EXITED_FILENAME)
+            totals = read_samples(exited_path) or {}
+            for path in exited:
+                add_samples(totals, read_samples(path) or {})
+            write_samples(exited_path, totals)
+            for path in exited:
+                os.remove(path)
+
+    ## Sum the counters of every live worker plus the folded totals of exited ones ##
+    def collect(self):
+        if not self.directory:
+            return self.snapshot()
+        self.maybe_flush(force=True)
+        self.fold_exited()
+        totals = {}
+        for filename in os.listdir(self.directory):
+            if filename.startswith("metrics_") and filename.endswith(".json"):
+                add_samples(totals, read_samples(os.path.join(self.directory, filename)) or {})
+        return totals
+
+
+## Counters of every exited worker, summed ##
+EXITED_FILENAME = "metrics_exited.json"
+
+## The pid a worker file (metrics_<pid>_<token>.json) belongs to, or None for any other file ##
+def worker_file_pid(filename):
+    if not (filename.startswith("metrics_") and filename.endswith(".json")):
+        return None
+    pid = filename[len("metrics_"):-len(".json")].split("_", 1)[0]
+    return int(pid) if pid.isdigit() else None
+
+def process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def read_samples(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+## Atomic rename, so readers never see half a file ##
+def write_samples(path, samples):
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(samples, f)
+    os.replace(temp_path, path)
+
+def add_samples(totals, samples):
+    for sample, value in samples.items():
+        totals[sample] = totals.get(sample, 0) + value
+
+
+## Render samples plus point-in-time gauges ({sample: value}) in the Prometheus text format ##
+def render_prometheus(samples, gauges=None):
+    families = {}
+    for sample, value in list(samples.items()) + list((gauges or {}).items()):
+        name = sample.split("{", 1)[0]
+        for suffix in ("_bucket", "_sum", "_count"):
+            if name.endswith(suffix) and name[:-len(suffix)] in METRIC_FAMILIES:
+                name = name[:-len(suffix)]
+        families.setdefault(name, []).append((sample, value))
+
+    lines = []
+    for name in sorted(families):
+        metric_type, help_text = METRIC_FAMILIES.get(name, ("untyped", ""))
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for sample, value in sorted(families[name], key=sample_sort_key):
+            lines.append(f"{sample} {format_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+## Build the registry named by RDG_METRICS_DIR - unset keeps metrics in-process (single worker) ##
+def create_metrics(directory, collect_generation):
+    return MetricsRegistry(collect_generation, directory=directory or None)
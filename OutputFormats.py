@@ -0,0 +1,139 @@
+## Output Formats By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import csv
+import io
+from JsonSerializer import dumps, dumps_lines, dumps_items
+
+###########################################
+
+## Every writer takes column batches - (size, {field: [values...]}) as yielded by iter_columns - ##
+## plus the schema's field order, and yields chunks (str or bytes) ready to stream ##
+
+## Zip one column batch into row tuples, keeping empty schemas at the right row count ##
+def batch_rows(size, columns, keys):
+    if not keys:
+        return [()] * size
+    return zip(*(columns[key] for key in keys))
+
+## Hand back whatever has been written to an in-memory buffer and empty it ##
+def drain_buffer(buffer):
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+## One JSON object per line ##
+def write_ndjson(batches, keys):
+    for size, columns in batches:
+        if size:
+            yield dumps_lines(dict(zip(keys, row)) for row in batch_rows(size, columns, keys))
+
+## A single JSON array of objects ##
+def write_json(batches, keys):
+    yield b"["
+    separator = b""
+    for size, columns in batches:
+        if size:
+            yield separator + dumps_items(dict(zip(keys, row)) for row in batch_rows(size, columns, keys))
+            separator = b","
+    yield b"]"
+
+## Compact JSON - field names once, then every record as an array: {"fields": [...], "rows": [[...], ...]} ##
+def write_json_rows(batches, keys):
+    yield b'{"fields":' + dumps(list(keys)) + b',"rows":['
+    separator = b""
+    for size, columns in batches:
+        if size:
+            yield separator + dumps_items(list(row) for row in batch_rows(size, columns, keys))
+            separator = b","
+    yield b"]}"
+
+## CSV with the header written once ##
+def write_csv(batches, keys):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(keys)
+    for size, columns in batches:
+        writer.writerows(batch_rows(size, columns, keys))
+        yield drain_buffer(buffer)
+    if buffer.tell():
+        yield drain_buffer(buffer)
+
+## MessagePack stream - the field names as one array, then each record as an array (needs msgpack) ##
+def write_msgpack(batches, keys):
+    import msgpack
+    packer = msgpack.Packer()
+    yield packer.pack(list(keys))
+    for size, columns in batches:
+        yield b"".join(packer.pack(list(row)) for row in batch_rows(size, columns, keys))
+
+## Apache Arrow IPC stream built straight from the column batches (needs pyarrow) ##
+def write_arrow(batches, keys):
+    import pyarrow as pa
+    sink = io.BytesIO()
+    writer = None
+    schema = None  ## Inferred from the first batch, then enforced so every batch matches ##
+    for size, columns in batches:
+        if not size:
+            continue
+        batch = pa.RecordBatch.from_pydict({key: columns[key] for key in keys}, schema=schema)
+        if writer is None:
+            schema = batch.schema
+            writer = pa.ipc.new_stream(sink, schema)
+        writer.write_batch(batch)
+        yield drain_buffer(sink)
+    if writer is not None:
+        writer.close()
+        yield drain_buffer(sink)
+
+## Multi-schema batches - schemas yields (name, keys, column batches), one schema after another ##
+
+## One JSON object with an array per schema - {"customers": [...], "orders": [...]} ##
+def write_json_batch(schemas):
+    yield b"{"
+    separator = b""
+    for name, keys, batches in schemas:
+        yield separator + dumps(name) + b":"
+        yield from write_json(batches, keys)
+        separator = b","
+    yield b"}"
+
+## One {"schema": ..., "record": {...}} object per line ##
+def write_ndjson_batch(schemas):
+    for name, keys, batches in schemas:
+        for size, columns in batches:
+            if size:
+                yield dumps_lines({"schema": name, "record": dict(zip(keys, row))} for row in batch_rows(size, columns, keys))
+
+## Formats offered for batches ##
+BATCH_FORMATS = {"json": write_json_batch, "ndjson": write_ndjson_batch}
+
+## Format name -> (mimetype, writer, optional module it needs) ##
+OUTPUT_FORMATS = {
+    "json": ("application/json", write_json, None),
+    "ndjson": ("application/x-ndjson", write_ndjson, None),
+    "json_rows": ("application/vnd.rdg.rows+json", write_json_rows, None),
+    "csv": ("text/csv", write_csv, None),
+    "msgpack": ("application/x-msgpack", write_msgpack, "msgpack"),
+    "arrow": ("application/vnd.apache.arrow.stream", write_arrow, "pyarrow"),
+}
+
+## Accept header media types -> format name ##
+FORMAT_MIMETYPES = {mimetype: name for name, (mimetype, _, _) in OUTPUT_FORMATS.items()}
+FORMAT_MIMETYPES["application/msgpack"] = "msgpack"
+FORMAT_MIMETYPES["application/vnd.msgpack"] = "msgpack"
+
+## True when the format's optional dependency (if any) is installed ##
+def format_available(name):
+    module = OUTPUT_FORMATS[name][2]
+    if module is None:
+        return True
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
+## Formats whose output is bytes rather than text ##
+BINARY_FORMATS = ("msgpack", "arrow")
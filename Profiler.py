@@ -0,0 +1,75 @@
+## Request Profiler By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import cProfile
+import heapq
+import itertools
+import pstats
+import threading
+import time
+
+###########################################
+
+## Keeps the N slowest profiled requests in memory, each with its top hotspots ##
+## cProfile can only run one profile per process at a time, so concurrent profile requests are turned away ##
+class ProfileStore:
+    def __init__(self, keep=10, top=25):
+        self.keep = keep
+        self.top = top
+        self.heap = []  ## (seconds, id, report) min-heap, so the fastest kept profile is dropped first ##
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.running = threading.Lock()
+
+    ## Run fn under cProfile and store the report - returns (result, report), or (None, None) if another profile is running ##
+    def run(self, fn, **details):
+        if not self.running.acquire(blocking=False):
+            return None, None
+        try:
+            profiler = cProfile.Profile()
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                result = fn()
+            finally:
+                profiler.disable()
+            seconds = time.perf_counter() - started
+        finally:
+            self.running.release()
+
+        report = dict(details, id=next(self.ids), seconds=seconds, hotspots=get_hotspots(profiler, self.top))
+        with self.lock:
+            entry = (seconds, report["id"], report)
+            if len(self.heap) < self.keep:
+                heapq.heappush(self.heap, entry)
+            else:
+                heapq.heappushpop(self.heap, entry)
+        return result, report
+
+    ## Stored profiles, slowest first, without their hotspots ##
+    def summaries(self):
+        with self.lock:
+            reports = [report for _, _, report in sorted(self.heap, reverse=True)]
+        return [{key: value for key, value in report.items() if key != "hotspots"} for report in reports]
+
+    def get(self, profile_id):
+        with self.lock:
+            for _, entry_id, report in self.heap:
+                if entry_id == profile_id:
+                    return report
+        return None
+
+
+## Top functions by own time, with call counts and cumulative time ##
+def get_hotspots(profiler, top):
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "own_seconds": own_time,
+            "cumulative_seconds": cumulative_time
+        }
+        for (filename, line, name), (_, calls, own_time, cumulative_time, _) in rows
+    ]
@@ -1,49 +1,180 @@
 ## Random Data Generator By Rajeen Kaleerathan  ##
 
 ## Imported Libraries ##
+import argparse
 import json
+import os
 import random
-from faker import Faker
-from faker_music import MusicProvider
-from colorama import Fore, Style, init
-import re  # Needed to clean country codes
+import sys
+from JsonSerializer import dumps_lines
+import threading
+import time
+from collections import namedtuple, deque
+from datetime import date, timedelta
+from Uniqueness import FeistelPermutation, ScalableBloomFilter, stable_key
 
-init()
+## Faker, faker_music, colorama and the process pool are imported on first use - importing this module stays cheap ##
 ###########################################
 
-fake = Faker()  # Faker instance that generates types of fake data
-import faker_music
-fake.add_provider(MusicProvider)
+## Build a Faker instance - loading Faker and its locale data dominates start-up, so nothing calls this at import ##
+def make_faker(locale=None, music=False):
+    from faker import Faker
+    instance = Faker(locale)
+    if music:
+        from faker_music import MusicProvider
+        instance.add_provider(MusicProvider)
+    return instance
+
+## faker_music's genre and instrument lists, loaded on first use ##
+music_lists = None
+
+def get_music_lists():
+    global music_lists
+    if music_lists is None:
+        from faker_music.genres import genre_list
+        from faker_music.instruments import instrument_list
+        music_lists = (genre_list, instrument_list)
+    return music_lists
+
+## CLI colours - plain text until init_cli_colours() imports colorama, so the API never loads it ##
+class PlainColours:
+    def __getattr__(self, name):
+        return ""
+
+Fore = Style = PlainColours()
+
+def init_cli_colours():
+    global Fore, Style
+    from colorama import Fore, Style, init
+    init()
+
+## Supported locales and their ISO 3166-1 alpha-2 country codes ##
+LOCALES = [
+    ('en_US', 'US'),
+    ('en_GB', 'GB'),
+    ('fr_FR', 'FR'),
+    ('de_DE', 'DE'),
+    ('en_CA', 'CA'),
+]
+
+## International calling code for each supported country ##
+LOCALE_CALLING_CODES = {
+    'US': '+1',
+    'GB': '+44',
+    'FR': '+33',
+    'DE': '+49',
+    'CA': '+1',
+}
 
 ## Stores the current record’s locale so Address and Country Code match ##
 def get_random_locale():
-    return random.choice([
-        ('en_US', 'US'),
-        ('en_GB', 'GB'),
-        ('fr_FR', 'FR'),
-        ('de_DE', 'DE'),
-        ('en_CA', 'CA'),
-    ])
+    return random.choice(LOCALES)
+
+## Holds the RNG and Faker instances that one generation run draws from ##
+## The main Faker instance is built by fake_factory the first time it is needed ##
+class GeneratorContext:
+    def __init__(self, fake_factory, rng, locale_fakers):
+        self.fake_factory = fake_factory
+        self.fake_instance = None
+        self.rng = rng
+        self.locale_fakers = locale_fakers  ## Faker(locale) loads every provider, so build each only once ##
+        self.stream_key = None
+        self.seeded_locales = set()
+
+    @property
+    def fake(self):
+        if self.fake_instance is None:
+            self.fake_instance = self.fake_factory()
+        return self.fake_instance
+
+    def get_locale_faker(self, locale):
+        localized_fake = self.locale_fakers.get(locale)
+        if localized_fake is None:
+            localized_fake = self.locale_fakers[locale] = make_faker(locale)
+        if self.stream_key is not None and locale not in self.seeded_locales:
+            localized_fake.seed_instance(f"{self.stream_key}:{locale}")
+            self.seeded_locales.add(locale)
+        return localized_fake
+
+    ## Reseed every source of randomness for one deterministic stream of values ##
+    def seed_stream(self, key):
+        self.stream_key = key
+        self.seeded_locales = set()
+        self.rng.seed(key)
+        self.fake.seed_instance(key)
+
+## Default context - a shared Faker and the random module, used for unseeded generation ##
+locale_fakers = {}
+default_context = GeneratorContext(lambda: make_faker(music=True), random, locale_fakers)
+
+## RandomDataGenerator.fake still works for callers, building the default Faker when first read ##
+def __getattr__(name):
+    if name == "fake":
+        return default_context.fake
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_locale_faker(locale):
+    return default_context.get_locale_faker(locale)
+
+## Seeded runs get their own Faker instances per thread so they never share state with unseeded requests ##
+seeded_contexts = threading.local()
+
+def get_seeded_context():
+    ctx = getattr(seeded_contexts, "ctx", None)
+    if ctx is None:
+        ctx = seeded_contexts.ctx = GeneratorContext(lambda: make_faker(music=True), random.Random(), {})
+    return ctx
+
+## Lookup tables for phone numbers and dates of birth, built once instead of per value ##
+
+## A phone number is a calling code followed by 10 local digits (what msisdn()[3:13] used to give) ##
+PHONE_DIGITS = 10
+PHONE_RANGE = 10 ** PHONE_DIGITS
+
+## Sanitized numeric prefix of a calling code - e.g. "+1 264" -> 1264 * 10**10, so an integer phone ##
+## number is just prefix + local number ##
+def calling_code_prefix(code):
+    return int("".join(char for char in code if char.isdigit())) * PHONE_RANGE
+
+## Prefix for each supported country - phone fields in a schema follow the record's locale, so this is ##
+## the table generate_data, the API, the export and the shipper draw from ##
+LOCALE_PHONE_PREFIXES = {code: calling_code_prefix(calling_code) for code, calling_code in LOCALE_CALLING_CODES.items()}
+
+## Faker's calling codes (duplicates kept, so codes are drawn as often as before) and their prefixes ##
+## Used by the row-level generators and batch_data_types, which are not tied to a locale ##
+def get_calling_code_table():
+    global calling_code_table
+    if calling_code_table is None:
+        from faker.providers.phone_number import Provider
+        codes = list(Provider.country_calling_codes)
+        calling_code_table = (codes, [calling_code_prefix(code) for code in codes])
+    return calling_code_table
+
+calling_code_table = None
+
+## Format a 10-digit local number as "1234 567890" ##
+def format_local_number(number):
+    head, tail = divmod(number, 1000000)
+    return f"{head:04d} {tail:06d}"
 
 ## Function to return realistic international phone number as a formatted string ##
 def generate_global_phone_string():
-    country_code = fake.country_calling_code()
-    number = fake.msisdn()[3:13]
-    return f"({country_code}) {number[:4]} {number[4:]}"
+    codes, _ = get_calling_code_table()
+    rng = default_context.rng
+    return f"({rng.choice(codes)}) {format_local_number(rng.randrange(PHONE_RANGE))}"
 
 
 ## Function to return international phone number as a numeric-only integer ##
 def generate_global_phone_integer():
-    raw_code = fake.country_calling_code()
-    country_code = re.sub(r"\D", "", raw_code)  # Remove + and spaces
-    number = fake.msisdn()[3:13]
-    return int(f"{country_code}{number}")
+    _, prefixes = get_calling_code_table()
+    rng = default_context.rng
+    return rng.choice(prefixes) + rng.randrange(PHONE_RANGE)
 
 
 ## Function to generate address and matching country code from same locale ##
 def generate_address_and_country():
     locale, code = get_random_locale()
-    localized_fake = Faker(locale)
+    localized_fake = get_locale_faker(locale)
     address = localized_fake.address().replace("\n", ", ")
     return {
         "Address": address,
@@ -52,23 +183,293 @@ def generate_address_and_country():
 
 ## Define generator functions mapped by standard data types ##
 available_data_types = {
-    "full_name": lambda: fake.name(),
-    "email_address": lambda: fake.email(),
+    "full_name": lambda: default_context.fake.name(),
+    "email_address": lambda: default_context.fake.email(),
     "phone_number": generate_global_phone_string,
     "phone_number_int": generate_global_phone_integer,
-    "full_address": lambda: fake.address().replace("\n", ", "),
+    "full_address": lambda: default_context.fake.address().replace("\n", ", "),
     "alpha2": lambda: get_random_locale()[1],    ## alpha2 looks at the ISO 3166-1 alpha-2 country code format. It’s a two letter country code used show the countries. ##
     "id_number": lambda: random.randint(1000, 999999),
     "boolean": lambda: random.choice([True, False]),
-    "date_iso": lambda: fake.date_of_birth(minimum_age=18, maximum_age=65).isoformat(),
+    "date_iso": lambda: default_context.rng.choice(get_date_iso_table()),
     ### Music Data fields ###
-    "music_genre": lambda: fake.music_genre(),
-    "music_instrument": lambda: fake.music_instrument(),
-    "artist_name": lambda: fake.name(),  # Fake artist name
-    "song_title": lambda: fake.sentence(nb_words=3).replace(".", ""),  # Remove period
-    "album_title": lambda: fake.catch_phrase()
+    "music_genre": lambda: default_context.fake.music_genre(),
+    "music_instrument": lambda: default_context.fake.music_instrument(),
+    "artist_name": lambda: default_context.fake.name(),  # Fake artist name
+    "song_title": lambda: default_context.fake.sentence(nb_words=3).replace(".", ""),  # Remove period
+    "album_title": lambda: default_context.fake.catch_phrase()
+}
+
+## Batch (columnar) generators - each returns a whole column of n values in one call ##
+
+## Date of birth window for ages 18-65, matching fake.date_of_birth's bounds ##
+def get_birth_date_window(today=None, minimum_age=18, maximum_age=65):
+    today = today or date.today()
+
+    def years_ago(years):
+        try:
+            return today.replace(year=today.year - years)
+        except ValueError:  ## 29th February in a non-leap year ##
+            return today.replace(year=today.year - years, day=28)
+
+    start = years_ago(maximum_age + 1) + timedelta(days=1)
+    end = years_ago(minimum_age)
+    return start, (end - start).days
+
+## Every date in today's window as an ISO string, indexed by day offset - rebuilt when the day changes ##
+def get_date_iso_table():
+    global date_iso_table
+    today = date.today()
+    if date_iso_table[0] != today:
+        start, span = get_birth_date_window(today)
+        ordinal = start.toordinal()
+        date_iso_table = (today, [date.fromordinal(ordinal + offset).isoformat() for offset in range(span + 1)])
+    return date_iso_table[1]
+
+date_iso_table = (None, None)
+
+## Every batch generator takes an optional GeneratorContext and uses the default one when omitted ##
+def batch_id_numbers(n, ctx=None):
+    return (ctx or default_context).rng.choices(range(1000, 1000000), k=n)
+
+def batch_booleans(n, ctx=None):
+    return (ctx or default_context).rng.choices((True, False), k=n)
+
+def batch_alpha2(n, ctx=None):
+    return (ctx or default_context).rng.choices([code for _, code in LOCALES], k=n)
+
+## Sampling the table picks a day offset into the window, with each ISO string formatted only once a day ##
+def batch_dates_iso(n, ctx=None):
+    return (ctx or default_context).rng.choices(get_date_iso_table(), k=n)
+
+## Schemas generate phone fields through the localized functions below - these locale-free batches serve ##
+## direct callers of batch_data_types. One draw per value picks both the calling code and the local number ##
+def draw_phone_parts(n, ctx, code_count):
+    return [divmod(value, PHONE_RANGE) for value in (ctx or default_context).rng.choices(range(code_count * PHONE_RANGE), k=n)]
+
+def batch_phone_strings(n, ctx=None):
+    codes, _ = get_calling_code_table()
+    return [f"({codes[index]}) {format_local_number(number)}" for index, number in draw_phone_parts(n, ctx, len(codes))]
+
+def batch_phone_integers(n, ctx=None):
+    _, prefixes = get_calling_code_table()
+    return [prefixes[index] + number for index, number in draw_phone_parts(n, ctx, len(prefixes))]
+
+def batch_addresses(n, ctx=None):
+    address = (ctx or default_context).fake.address
+    return [address().replace("\n", ", ") for _ in range(n)]
+
+## MusicProvider draws from the global random module, so sample its lists through the context RNG instead ##
+def batch_music_genres(n, ctx=None):
+    genre_list, _ = get_music_lists()
+    return [genre["genre"] for genre in (ctx or default_context).rng.choices(genre_list, k=n)]
+
+def batch_music_instruments(n, ctx=None):
+    _, instrument_list = get_music_lists()
+    choice = (ctx or default_context).rng.choice
+    return [choice(choice(instrument_list)["instruments"]) for _ in range(n)]
+
+def batch_song_titles(n, ctx=None):
+    sentence = (ctx or default_context).fake.sentence
+    return [sentence(nb_words=3).replace(".", "") for _ in range(n)]
+
+## Wrap a no-argument Faker method name so the call overhead is paid once per column, not per lookup ##
+def batch_faker(method_name):
+    def batch(n, ctx=None):
+        method = getattr((ctx or default_context).fake, method_name)
+        return [method() for _ in range(n)]
+    return batch
+
+batch_data_types = {
+    "full_name": batch_faker("name"),
+    "email_address": batch_faker("email"),
+    "phone_number": batch_phone_strings,
+    "phone_number_int": batch_phone_integers,
+    "full_address": batch_addresses,
+    "alpha2": batch_alpha2,
+    "id_number": batch_id_numbers,
+    "boolean": batch_booleans,
+    "date_iso": batch_dates_iso,
+    "music_genre": batch_music_genres,
+    "music_instrument": batch_music_instruments,
+    "artist_name": batch_faker("name"),
+    "song_title": batch_song_titles,
+    "album_title": batch_faker("catch_phrase")
 }
 
+## Locale-aware batch generators - called once per locale group with (n, locale, country code) ##
+def batch_localized_names(n, locale, code, ctx=None):
+    name = (ctx or default_context).get_locale_faker(locale).name
+    return [name() for _ in range(n)]
+
+def batch_localized_addresses(n, locale, code, ctx=None):
+    address = (ctx or default_context).get_locale_faker(locale).address
+    return [address().replace("\n", ", ") for _ in range(n)]
+
+## Local numbers come from the locale Faker's own random stream, which seeded runs key per locale ##
+def draw_local_numbers(n, locale, ctx):
+    return (ctx or default_context).get_locale_faker(locale).random.choices(range(PHONE_RANGE), k=n)
+
+def batch_localized_phone_strings(n, locale, code, ctx=None):
+    calling_code = LOCALE_CALLING_CODES[code]
+    return [f"({calling_code}) {format_local_number(number)}" for number in draw_local_numbers(n, locale, ctx)]
+
+def batch_localized_phone_integers(n, locale, code, ctx=None):
+    prefix = LOCALE_PHONE_PREFIXES[code]
+    return [prefix + number for number in draw_local_numbers(n, locale, ctx)]
+
+## Types that share one locale per record so name, address, phone and country agree ##
+localized_batch_data_types = {
+    "full_name": batch_localized_names,
+    "full_address": batch_localized_addresses,
+    "alpha2": lambda n, locale, code, ctx=None: [code] * n,
+    "phone_number": batch_localized_phone_strings,
+    "phone_number_int": batch_localized_phone_integers
+}
+
+## Optional value pools - pre-generated reservoirs for Faker types that are expensive per call ##
+POOLED_DATA_TYPES = ("full_name", "full_address", "email_address", "song_title", "album_title")
+
+## Bounded reservoir of pre-generated values, refilled by a background thread ##
+class ValuePool:
+    def __init__(self, batch_func, size=10000, refresh_fraction=0.1, eviction="random"):
+        if eviction not in ("random", "fifo"):
+            raise ValueError(f"Unknown eviction policy: {eviction}")
+        self.batch_func = batch_func
+        self.size = size
+        self.refresh_fraction = refresh_fraction
+        self.eviction = eviction
+        self.values = []
+        self.next_slot = 0
+        self.hits = 0
+        self.misses = 0
+        self.sampled = 0  ## Values served since the last refresh pass ##
+
+    def is_warm(self):
+        return len(self.values) >= self.size
+
+    ## Fill the pool up to size, then replace up to refresh_fraction of it so values keep changing ##
+    ## A warm pool only replaces as many values as were sampled since the last pass, so an idle pool costs nothing ##
+    def refill(self, chunk=1000):
+        if not self.is_warm():
+            self.values.extend(self.batch_func(min(chunk, self.size - len(self.values))))
+            return
+        sampled, self.sampled = self.sampled, 0
+        count = min(sampled, max(1, int(self.size * self.refresh_fraction)))
+        if not count:
+            return
+        fresh = self.batch_func(count)
+        if self.eviction == "fifo":
+            for value in fresh:
+                self.values[self.next_slot] = value
+                self.next_slot = (self.next_slot + 1) % self.size
+        else:
+            for slot, value in zip(random.sample(range(self.size), len(fresh)), fresh):
+                self.values[slot] = value
+
+    ## Sample n values from the pool; fall back to direct generation until it is warm ##
+    def sample(self, n):
+        if not self.is_warm():
+            self.misses += n
+            return self.batch_func(n)
+        self.hits += n
+        self.sampled += n
+        return random.choices(self.values, k=n)
+
+    ## Drop every value, so the pool refills from scratch ##
+    def clear(self):
+        self.values = []
+        self.next_slot = 0
+        self.sampled = 0
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "filled": len(self.values),
+            "eviction": self.eviction,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+value_pools = {}
+
+## Pools are keyed by data type, plus locale for locale-aware types (e.g. "full_address:fr_FR") ##
+def get_pool_key(dtype, locale=None):
+    return f"{dtype}:{locale}" if locale else dtype
+
+pool_stop_event = threading.Event()
+pool_thread = None
+pool_thread_pid = None
+pool_refresh_interval = 1.0
+pool_thread_lock = threading.Lock()
+
+## Background loop: top up cold pools quickly, then refresh warm ones every refresh_interval ##
+## Refresh work is bounded by what requests consumed, at most size * refresh_fraction values per pool per pass ##
+def run_pool_refill(refresh_interval, stop_event):
+    while not stop_event.is_set():
+        pools = list(value_pools.values())
+        for pool in pools:
+            pool.refill()
+        if all(pool.is_warm() for pool in pools):
+            stop_event.wait(refresh_interval)
+
+## Start pooling for the expensive data types ##
+def enable_value_pools(size=10000, refresh_interval=1.0, refresh_fraction=0.1, eviction="random", data_types=POOLED_DATA_TYPES):
+    global pool_refresh_interval
+    disable_value_pools()
+    for dtype in data_types:
+        localized_batch = localized_batch_data_types.get(dtype)
+        if localized_batch:
+            ## Locale-aware types get one pool per locale so pooled values still match the record ##
+            for locale, code in LOCALES:
+                batch_func = lambda n, batch=localized_batch, locale=locale, code=code: batch(n, locale, code)
+                value_pools[get_pool_key(dtype, locale)] = ValuePool(batch_func, size, refresh_fraction, eviction)
+        else:
+            value_pools[get_pool_key(dtype)] = ValuePool(batch_data_types[dtype], size, refresh_fraction, eviction)
+    pool_refresh_interval = refresh_interval
+    start_pool_refill()
+
+def start_pool_refill():
+    global pool_thread, pool_thread_pid, pool_stop_event
+    pool_stop_event = threading.Event()
+    pool_thread = threading.Thread(target=run_pool_refill, args=(pool_refresh_interval, pool_stop_event), daemon=True)
+    pool_thread.start()
+    pool_thread_pid = os.getpid()
+
+## Threads do not survive fork, so a worker forked from a preloaded master restarts the refill loop on first use ##
+def ensure_pool_refill():
+    if pool_thread_pid != os.getpid():
+        with pool_thread_lock:
+            if pool_thread_pid != os.getpid() and value_pools:
+                start_pool_refill()
+
+## Stop the refill thread and drop all pools ##
+def disable_value_pools():
+    global pool_thread, pool_thread_pid
+    pool_stop_event.set()
+    if pool_thread is not None and pool_thread_pid == os.getpid():
+        pool_thread.join()
+    pool_thread = None
+    pool_thread_pid = None
+    value_pools.clear()
+
+## Hit/miss counters for every active pool ##
+def get_pool_stats():
+    return {dtype: pool.stats() for dtype, pool in value_pools.items()}
+
+## Unseeded Faker instances all draw from faker.generator.random, which - unlike the random module - is not ##
+## reseeded after fork. Without this, every worker forked from a warmed-up master (gunicorn --preload) ##
+## would produce the same values, and would serve the same pooled values the master had filled ##
+def reseed_after_fork():
+    faker_generator = sys.modules.get("faker.generator")
+    if faker_generator is not None:
+        faker_generator.random.seed()
+    for pool in value_pools.values():
+        pool.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reseed_after_fork)
+
 ## User-friendly field options to display in CLI ##
 available_field_types = {
     "Full Name": "full_name",
@@ -145,52 +546,621 @@ def get_object_count():
             print(Fore.RED + "Please enter a valid positive integer.\n" + Style.RESET_ALL)
 
 
-## Ask user for output format (NDJSON / JSON) using numbered options ##
+## CLI output format options - display name → format name ##
+cli_output_formats = {
+    "NDJSON": "ndjson",
+    "JSON": "json",
+    "JSON Rows (header + arrays)": "json_rows",
+    "CSV": "csv",
+    "MessagePack": "msgpack",
+    "Arrow IPC Stream": "arrow"
+}
+
+## Ask user for output format using numbered options ##
 def get_output_format():
+    options = list(cli_output_formats.items())
     while True:
         print("\nOutput format:")
-        print("1. NDJSON")
-        print("2. JSON")
-        choice = input("Choose format (1 or 2): ").strip()
-        if choice == "1":
-            return "ndjson"
-        elif choice == "2":
-            return "json"
-        else:
-            print(Fore.RED + "Invalid input. Please choose 1 or 2.\n" + Style.RESET_ALL)
+        for i, (display_name, _) in enumerate(options, 1):
+            print(f"{i}. {display_name}")
+        choice = input(f"Choose format (1-{len(options)}): ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(options):
+            return options[int(choice) - 1][1]
+        print(Fore.RED + f"Invalid input. Please choose 1-{len(options)}.\n" + Style.RESET_ALL)
+
+## Unique values for types with a small, enumerable value space come from a permutation of that space ##
+## Every other type is de-duplicated against a Bloom filter of the values already produced ##
+def get_music_instrument_domain():
+    _, instrument_list = get_music_lists()
+    return list(dict.fromkeys(name for family in instrument_list for name in family["instruments"]))
 
-## Generate fake data using field-to-datatype mappings ##
-def generate_data(fields, count):
-    result = []
+unique_domains = {
+    "id_number": lambda: range(1000, 1000000),
+    "boolean": lambda: (True, False),
+    "date_iso": get_date_iso_table,
+    "music_genre": lambda: list(dict.fromkeys(genre["genre"] for genre in get_music_lists()[0])),
+    "music_instrument": get_music_instrument_domain,
+}
+
+## alpha2 has to match each record's locale, so it can never be made unique ##
+NON_UNIQUE_DATA_TYPES = ("alpha2",)
+
+## Draws allowed for one record before a de-duplicated field is treated as exhausted ##
+UNIQUE_MAX_ATTEMPTS = 100
+
+## Foreign keys sample values of another schema's field - {"type": "foreign_key", "schema": ..., "field": ...} ##
+## They can only be generated alongside that parent schema (see Relations.py) ##
+FOREIGN_KEY_TYPE = "foreign_key"
+
+## Compiled schema plans - data types are resolved once, not on every batch ##
+## unique is None, "permutation" (enumerable types) or "filter" (de-duplicated against a Bloom filter) ##
+## reference is the (schema, field) a foreign key points at ##
+FieldPlan = namedtuple("FieldPlan", ["field", "dtype", "strategy", "batch_func", "unique", "reference"], defaults=(None, None))
+SchemaPlan = namedtuple("SchemaPlan", ["keys", "fields", "localized"])
 
-    for _ in range(count):
-        obj = {}
+## A field is a data type name, {"type": <data type>, "unique": true|false} or a foreign key spec ##
+## Returns (dtype, unique, reference) ##
+def parse_field_spec(field, spec):
+    if not isinstance(spec, dict):
+        return spec, False, None
+    if spec.get("type") == FOREIGN_KEY_TYPE:
+        schema, key_field = spec.get("schema"), spec.get("field")
+        if set(spec) - {"type", "schema", "field"} or not isinstance(schema, str) or not isinstance(key_field, str):
+            raise ValueError(f"Invalid foreign key for field '{field}'. Use {{\"type\": \"foreign_key\", \"schema\": ..., \"field\": ...}}.")
+        return FOREIGN_KEY_TYPE, False, (schema, key_field)
+    unique = spec.get("unique", False)
+    if set(spec) - {"type", "unique"} or not isinstance(unique, bool):
+        raise ValueError(f"Invalid spec for field '{field}'. Use a data type name or {{\"type\": ..., \"unique\": true}}.")
+    return spec.get("type"), unique, None
+
+## Validate a fields dict and resolve each data type to its batch generator and strategy ##
+def compile_schema(fields, strict=False):
+    field_plans = []
+
+    for field, spec in fields.items():
+        try:
+            dtype, unique, reference = parse_field_spec(field, spec)
+        except ValueError:
+            if strict:
+                raise
+            field_plans.append(FieldPlan(field, spec, "invalid", None))
+            continue
 
-        for field, dtype in fields.items():
-            generator_func = available_data_types.get(dtype)
-            if generator_func:
-                obj[field] = generator_func()
+        if reference is not None:
+            field_plan = FieldPlan(field, dtype, "reference", None, reference=reference)
+        elif isinstance(dtype, str) and dtype in localized_batch_data_types:
+            field_plan = FieldPlan(field, dtype, "localized", localized_batch_data_types[dtype])
+        elif isinstance(dtype, str) and dtype in batch_data_types:
+            field_plan = FieldPlan(field, dtype, "batch", batch_data_types[dtype])
+        elif strict:
+            raise ValueError(f"Unknown data type '{dtype}' for field '{field}'.")
+        else:
+            field_plans.append(FieldPlan(field, dtype, "invalid", None))
+            continue
+
+        if unique:
+            if dtype in NON_UNIQUE_DATA_TYPES:
+                raise ValueError(f"Data type '{dtype}' for field '{field}' cannot be unique.")
+            if dtype in unique_domains:
+                field_plan = field_plan._replace(strategy="permutation", batch_func=None, unique="permutation")
             else:
-                obj[field] = f"[Invalid: {dtype}]"
+                field_plan = field_plan._replace(unique="filter")
+        field_plans.append(field_plan)
+
+    return SchemaPlan(
+        keys=tuple(fields),
+        fields=tuple(field_plans),
+        localized=any(plan.strategy == "localized" for plan in field_plans)
+    )
+
+## Accept either a raw fields dict or an already compiled SchemaPlan ##
+def get_schema_plan(fields):
+    return fields if isinstance(fields, SchemaPlan) else compile_schema(fields)
+
+## The plain fields dict a plan was compiled from - what worker processes receive ##
+def get_plan_fields(plan):
+    fields = {}
+    for field_plan in plan.fields:
+        if field_plan.reference:
+            fields[field_plan.field] = {"type": FOREIGN_KEY_TYPE, "schema": field_plan.reference[0], "field": field_plan.reference[1]}
+        elif field_plan.unique:
+            fields[field_plan.field] = {"type": field_plan.dtype, "unique": True}
+        else:
+            fields[field_plan.field] = field_plan.dtype
+    return fields
+
+## Foreign keys the plan needs - {field: (schema, field)} ##
+def get_plan_references(plan):
+    return {field_plan.field: field_plan.reference for field_plan in plan.fields if field_plan.reference}
+
+## Raise unless every foreign key field has a parent key index to sample from ##
+def check_references(plan, references):
+    for field, (schema, key_field) in get_plan_references(plan).items():
+        if not references or field not in references:
+            raise ValueError(
+                f"Field '{field}' is a foreign key to '{schema}.{key_field}'; generate it in a batch with schema '{schema}'."
+            )
+        if not len(references[field]):
+            raise ValueError(f"Field '{field}' references '{schema}.{key_field}', which has no values.")
+
+## Raise up front when a permutation-backed unique field has fewer distinct values than records requested ##
+def check_unique_capacity(fields, count):
+    for field_plan in get_schema_plan(fields).fields:
+        if field_plan.unique == "permutation":
+            capacity = len(unique_domains[field_plan.dtype]())
+            if count > capacity:
+                raise ValueError(
+                    f"Field '{field_plan.field}' is unique but '{field_plan.dtype}' only has {capacity} distinct values; {count} records requested."
+                )
+
+## Filter-backed unique fields depend on every earlier record, so they are generated in one process, in order ##
+def has_filtered_unique(plan):
+    return any(field_plan.unique == "filter" for field_plan in plan.fields)
+
+## Per-run state for a plan's unique fields: a keyed permutation or a Bloom filter per field ##
+## Permutations are keyed by the seed, so any chunk or worker can compute record N on its own ##
+class UniqueState:
+    def __init__(self, plan, seed=None):
+        self.domains = {}
+        self.permutations = {}
+        self.filters = {}
+        for index, field_plan in enumerate(plan.fields):
+            if field_plan.unique == "permutation":
+                domain = self.domains[field_plan.field] = unique_domains[field_plan.dtype]()
+                key = stable_key(f"{seed}:{index}") if seed is not None else random.getrandbits(64)
+                self.permutations[field_plan.field] = FeistelPermutation(len(domain), key)
+            elif field_plan.unique == "filter":
+                self.filters[field_plan.field] = ScalableBloomFilter()
+
+    ## Values for records [start, start + count) of a permutation-backed field ##
+    def permuted_column(self, field_plan, start, count):
+        domain = self.domains[field_plan.field]
+        permutation = self.permutations[field_plan.field]
+        if start + count > len(domain):
+            raise ValueError(
+                f"Field '{field_plan.field}' is unique but '{field_plan.dtype}' only has {len(domain)} distinct values."
+            )
+        return [domain[permutation[row]] for row in range(start, start + count)]
+
+    ## Replace every value already seen - regenerate(row) draws a fresh value for that record ##
+    def deduplicate(self, field_plan, column, regenerate):
+        seen = self.filters[field_plan.field]
+        for row, value in enumerate(column):
+            attempts = 0
+            while not seen.add(value):
+                attempts += 1
+                if attempts > UNIQUE_MAX_ATTEMPTS:
+                    raise ValueError(
+                        f"Field '{field_plan.field}' ran out of unique '{field_plan.dtype}' values after {UNIQUE_MAX_ATTEMPTS} attempts."
+                    )
+                value = regenerate(row, attempts)
+            column[row] = value
+
+## Cumulative generation cost per data type - {dtype: [calls, values, seconds]} ##
+## Timed once per column batch, never per value, so the hot loop stays untouched ##
+generation_timings = {}
+generation_timings_lock = threading.Lock()
+
+def record_generation_timing(dtype, values, seconds):
+    with generation_timings_lock:
+        timing = generation_timings.get(dtype)
+        if timing is None:
+            generation_timings[dtype] = [1, values, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += values
+            timing[2] += seconds
+
+## Fold timings measured elsewhere (e.g. in a worker process) into this process's totals ##
+def merge_generation_timings(timings):
+    with generation_timings_lock:
+        for dtype, (calls, values, seconds) in timings.items():
+            timing = generation_timings.setdefault(dtype, [0, 0, 0.0])
+            timing[0] += calls
+            timing[1] += values
+            timing[2] += seconds
+
+def get_generation_timings():
+    with generation_timings_lock:
+        return {dtype: list(timing) for dtype, timing in generation_timings.items()}
+
+## Hand back this process's timings and reset them - used by worker processes after each chunk ##
+def drain_generation_timings():
+    with generation_timings_lock:
+        timings = dict(generation_timings)
+        generation_timings.clear()
+        return timings
+
+## Build one locale-aware column by generating each locale's rows as a single batch ##
+def generate_localized_column(field_plan, locale_rows, count, ctx, use_pools):
+    column = [None] * count
+
+    for (locale, code), rows in locale_rows.items():
+        pool = value_pools.get(get_pool_key(field_plan.dtype, locale)) if use_pools else None
+        values = pool.sample(len(rows)) if pool else field_plan.batch_func(len(rows), locale, code, ctx)
+        for row, value in zip(rows, values):
+            column[row] = value
+
+    return column
+
+## Draw one replacement value for a record of a de-duplicated field ##
+## Seeded runs reseed per record, so replacements never depend on how the dataset is chunked ##
+def make_regenerator(field_plan, index, row_locales, ctx, stream_key):
+    def regenerate(row, attempt):
+        if stream_key is not None and attempt == 1:
+            ctx.seed_stream(f"{stream_key}:{index}:unique:{row}")
+        if field_plan.strategy == "localized":
+            locale, code = row_locales[row]
+            return field_plan.batch_func(1, locale, code, ctx)[0]
+        return field_plan.batch_func(1, ctx)[0]
+    return regenerate
+
+## Generate each field as a whole column - returns {field: [values...]} ##
+## With a stream_key, every column is reseeded from it so the first k values never depend on count ##
+## unique holds the run's UniqueState and start is the index of the first record in this batch ##
+## references maps each foreign key field to the parent keys it samples from ##
+def generate_columns(fields, count, ctx=None, stream_key=None, unique=None, start=0, references=None):
+    plan = get_schema_plan(fields)
+    ctx = ctx or default_context
+    use_pools = stream_key is None and bool(value_pools)
+    columns = {}
+    if use_pools:
+        ensure_pool_refill()
+    if unique is None and any(field_plan.unique for field_plan in plan.fields):
+        unique = UniqueState(plan)
+
+    ## Pick one locale per record, shared by every locale-aware field in that record ##
+    locale_rows = {}
+    if plan.localized:
+        if stream_key is not None:
+            ctx.seed_stream(f"{stream_key}:locale")
+        for row, locale in enumerate(ctx.rng.choices(LOCALES, k=count)):
+            locale_rows.setdefault(locale, []).append(row)
+
+    row_locales = None
+    for index, field_plan in enumerate(plan.fields):
+        if field_plan.strategy == "skip":
+            continue
+        if stream_key is not None:
+            ctx.seed_stream(f"{stream_key}:{index}")
+        ## Pools hold a limited set of values, so unique fields always generate directly ##
+        field_pools = use_pools and not field_plan.unique
+        started = time.perf_counter()
+        if field_plan.strategy == "localized":
+            columns[field_plan.field] = generate_localized_column(field_plan, locale_rows, count, ctx, field_pools)
+        elif field_plan.strategy == "batch":
+            pool = value_pools.get(field_plan.dtype) if field_pools else None
+            columns[field_plan.field] = pool.sample(count) if pool else field_plan.batch_func(count, ctx)
+        elif field_plan.strategy == "permutation":
+            columns[field_plan.field] = unique.permuted_column(field_plan, start, count)
+        elif field_plan.strategy == "reference":
+            columns[field_plan.field] = ctx.rng.choices(references[field_plan.field], k=count)
+        else:
+            columns[field_plan.field] = [f"[Invalid: {field_plan.dtype}]"] * count
+            continue
+        if field_plan.unique == "filter":
+            if field_plan.strategy == "localized" and row_locales is None:
+                row_locales = [None] * count
+                for locale, rows in locale_rows.items():
+                    for row in rows:
+                        row_locales[row] = locale
+            regenerate = make_regenerator(field_plan, index, row_locales, ctx, stream_key)
+            unique.deduplicate(field_plan, columns[field_plan.field], regenerate)
+        record_generation_timing(field_plan.dtype, count, time.perf_counter() - started)
+
+    return columns
+
+## Zip a columnar batch back into a list of records ##
+def columns_to_records(columns, count, keys=None):
+    if not columns:
+        return [{} for _ in range(count)]
+    keys = keys or tuple(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+## Records generated per columnar batch when streaming ##
+BATCH_SIZE = 1000
+
+## Seeded datasets are split into fixed blocks, each with its own seed, so any record can be reached directly ##
+SEED_BLOCK_SIZE = 1000
+
+## Column batches are (size, {field: [values...]}) - size is kept so field-less schemas still yield records ##
+
+## Yield column batches for [offset, offset + count) of the dataset identified by seed, one block at a time ##
+def iter_seeded_columns(plan, count, seed, offset, references=None):
+    ctx = get_seeded_context()
+    end = offset + count
+    block = offset // SEED_BLOCK_SIZE
+    unique = UniqueState(plan, seed)
+
+    ## Filter-backed unique fields must see every earlier record, so replay just those fields up to the first block ##
+    if has_filtered_unique(plan) and block:
+        replay_plan = plan._replace(fields=tuple(
+            field_plan if field_plan.unique == "filter" else field_plan._replace(strategy="skip")
+            for field_plan in plan.fields
+        ))
+        for replay_block in range(block):
+            generate_columns(replay_plan, SEED_BLOCK_SIZE, ctx, f"{seed}:{replay_block}", unique, replay_block * SEED_BLOCK_SIZE)
+
+    while block * SEED_BLOCK_SIZE < end:
+        block_start = block * SEED_BLOCK_SIZE
+        size = min(SEED_BLOCK_SIZE, end - block_start)
+        columns = generate_columns(plan, size, ctx, f"{seed}:{block}", unique, block_start, references)
+        skip = max(0, offset - block_start)
+        if skip:
+            columns = {field: column[skip:] for field, column in columns.items()}
+        yield size - skip, columns
+        block += 1
+
+## Process-pool backend - below PARALLEL_THRESHOLD records the pool costs more than it saves ##
+PARALLEL_THRESHOLD = 20000
+PARALLEL_CHUNK_SIZE = 10 * SEED_BLOCK_SIZE
+
+process_pools = {}
+
+## Runs once in each worker process so Faker and its providers are loaded before the first chunk ##
+def init_generation_worker():
+    get_seeded_context()
+
+## Worker entry point - plans hold closures, so workers receive the plain fields dict ##
+## Returns column batches, which pickle far smaller than lists of dicts ##
+## Returns the chunk's column batches plus the worker's generation timings for the parent to merge ##
+def generate_chunk(fields, count, seed, offset):
+    batches = list(iter_seeded_columns(compile_schema(fields), count, seed, offset))
+    return batches, drain_generation_timings()
+
+def get_process_pool(workers):
+    pool = process_pools.get(workers)
+    if pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = process_pools[workers] = ProcessPoolExecutor(max_workers=workers, initializer=init_generation_worker)
+    return pool
+
+## Spread a seeded range over worker processes and yield column batches in order as chunks complete ##
+## Chunks are seeded slices of one dataset, so the output matches a single-process run with the same seed ##
+def iter_parallel_columns(plan, count, seed, offset, workers):
+    pool = get_process_pool(workers)
+    fields = get_plan_fields(plan)
+    end = offset + count
+    pending = deque()
+    next_offset = offset
+
+    while next_offset < end or pending:
+        ## Keep at most two chunks per worker in flight so memory stays bounded ##
+        while next_offset < end and len(pending) < workers * 2:
+            size = min(PARALLEL_CHUNK_SIZE, end - next_offset)
+            pending.append(pool.submit(generate_chunk, fields, size, seed, next_offset))
+            next_offset += size
+        batches, timings = pending.popleft().result()
+        merge_generation_timings(timings)
+        yield from batches
+
+## Lazily yield column batches - the shared engine behind iter_data and the columnar output formats ##
+## A seed makes the output reproducible; offset skips straight to record N of that seeded dataset ##
+## workers > 1 generates large counts in a process pool ##
+## references supplies parent keys for foreign key fields - such plans stay in this process ##
+def iter_columns(fields, count, seed=None, offset=0, workers=1, references=None):
+    plan = get_schema_plan(fields)
+    check_unique_capacity(plan, offset + count)
+    check_references(plan, references)
+    if workers > 1 and count >= PARALLEL_THRESHOLD and not has_filtered_unique(plan) and not references:
+        if seed is None:
+            seed = random.getrandbits(63)
+        yield from iter_parallel_columns(plan, count, seed, offset, workers)
+        return
+    if seed is not None:
+        yield from iter_seeded_columns(plan, count, seed, offset, references)
+        return
+
+    unique = UniqueState(plan)
+    position = offset
+    while position < offset + count:
+        size = min(BATCH_SIZE, offset + count - position)
+        yield size, generate_columns(plan, size, unique=unique, start=position, references=references)
+        position += size
 
-        result.append(obj)
+## Lazily yield fake records so callers can stream without holding the full list ##
+def iter_data(fields, count, seed=None, offset=0, workers=1):
+    plan = get_schema_plan(fields)
+    for size, columns in iter_columns(plan, count, seed, offset, workers):
+        yield from columns_to_records(columns, size, plan.keys)
 
-    return result
+## Generate fake data using field-to-datatype mappings (a fields dict or a compiled SchemaPlan) ##
+def generate_data(fields, count, columnar=False, seed=None, offset=0, workers=1):
+    plan = get_schema_plan(fields)
+    if columnar:
+        result = {key: [] for key in plan.keys}
+        for _, columns in iter_columns(plan, count, seed, offset, workers):
+            for key, column in columns.items():
+                result[key].extend(column)
+        return result
+    return list(iter_data(plan, count, seed, offset, workers))
 
 ## Display generated data in chosen format ##
 def display_data(data, fmt):
     print()
     print(Fore.LIGHTGREEN_EX + "Generated Data:\n" + Style.RESET_ALL)
     if fmt == "ndjson":
-        for item in data:
-            print(json.dumps(item))
-    else:  ## json
+        sys.stdout.write(dumps_lines(data).decode())
+    elif fmt == "json":
         print(json.dumps(data, indent=2))
+    else:
+        write_formatted(data, fmt)
     print()
 
+## Write records through one of the OutputFormats writers ##
+## Without out, bytes chunks (JSON, msgpack, Arrow) go to the raw stdout buffer and str chunks (CSV) to stdout ##
+def write_formatted(data, fmt, out=None):
+    from OutputFormats import OUTPUT_FORMATS, format_available
+    if not format_available(fmt):
+        print(Fore.RED + f"Format '{fmt}' needs an optional package that is not installed." + Style.RESET_ALL)
+        return
+    keys = tuple(data[0]) if data else ()
+    columns = {key: [record[key] for record in data] for key in keys}
+    writer = OUTPUT_FORMATS[fmt][1]
+    for chunk in writer([(len(data), columns)], keys):
+        if out is not None:
+            out.write(chunk)
+        elif isinstance(chunk, bytes):
+            sys.stdout.flush()
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+        else:
+            sys.stdout.write(chunk)
+    (out or sys.stdout).flush()
+
+
+## Build every Faker instance and run each data type once, default and seeded, so the first request pays nothing ##
+## Called by a preloaded gunicorn master (RDG_WARM_UP=1) so every forked worker starts ready ##
+def warm_up():
+    for ctx in (default_context, get_seeded_context()):
+        for batch_func in batch_data_types.values():
+            batch_func(1, ctx)
+        for locale, code in LOCALES:
+            for localized_batch in localized_batch_data_types.values():
+                localized_batch(1, locale, code, ctx)
+
+## Non-interactive export - stream a schema file's records to a file or stdout ##
+
+## Compression picked from the output file's extension when --compress is not given ##
+EXPORT_COMPRESSION_EXTENSIONS = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+def build_export_parser():
+    parser = argparse.ArgumentParser(
+        description="Random Data Generator - run with no arguments for the interactive prompts, or pass --schema to export."
+    )
+    parser.add_argument("--schema", required=True, help='JSON file holding a fields dict, or {"fields": {...}, "count": N} as POSTed to /schemas')
+    parser.add_argument("--count", type=int, help="records to export (defaults to the schema file's count)")
+    parser.add_argument("--seed", type=int, help="seed for a reproducible export")
+    parser.add_argument("--offset", type=int, default=0, help="first record of the seeded dataset to export")
+    parser.add_argument("--format", default="ndjson", choices=list(cli_output_formats.values()), help="output format (default: ndjson)")
+    parser.add_argument("--output", default="-", help="output file, or - for stdout (default)")
+    parser.add_argument("--compress", choices=["none", "gzip", "zstd"], help="compress the output (default: from the output file extension)")
+    parser.add_argument("--level", type=int, help="compression level (gzip default 6, zstd default 3)")
+    parser.add_argument("--workers", type=int, default=1, help="generate in this many processes (default 1)")
+    parser.add_argument("--progress", action="store_true", help="print progress and throughput to stderr")
+    return parser
+
+## Read a schema file - either a bare fields dict or a /schemas body with fields and count ##
+def load_schema_file(path):
+    with open(path) as f:
+        schema = json.load(f)
+    if not isinstance(schema, dict):
+        raise ValueError(f"{path} must hold a JSON object - a fields mapping or {{\"fields\": ..., \"count\": ...}}.")
+    if isinstance(schema.get("fields"), dict):
+        return schema["fields"], schema.get("count")
+    return schema, None
+
+## Open the destination, wrapped in a streaming compressor - returns (stream to write, underlying file) ##
+def open_export_output(path, compression, level=None):
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd compression needs the 'zstandard' package.")
+    raw = sys.stdout.buffer if path == "-" else open(path, "wb", buffering=1024 * 1024)
+    if compression == "gzip":
+        import gzip
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6 if level is None else level), raw
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=3 if level is None else level).stream_writer(raw, closefd=False), raw
+    return raw, raw
+
+## Returns report(records, bytes_written, final=False), printing at most once per interval to stderr ##
+def make_progress_reporter(total, interval=1.0, stream=None):
+    stream = stream or sys.stderr
+    started = time.perf_counter()
+    last = [0.0]
+
+    def report(records, bytes_written, final=False):
+        now = time.perf_counter()
+        if not final and now - last[0] < interval:
+            return
+        last[0] = now
+        elapsed = max(now - started, 1e-9)
+        percent = records / total * 100 if total else 100.0
+        stream.write(
+            f"\r[export] {records:,}/{total:,} records ({percent:.0f}%) | "
+            f"{records / elapsed:,.0f} rec/s | {bytes_written / 1e6:,.1f} MB"
+        )
+        if final:
+            stream.write(f" | {elapsed:.1f}s\n")
+        stream.flush()
+    return report
+
+## Stream count records through a format writer into out, one column batch at a time ##
+## Returns (records, bytes written before compression) ##
+def export_data(fields, count, out, fmt="ndjson", seed=None, offset=0, workers=1, progress=None):
+    from OutputFormats import OUTPUT_FORMATS
+    plan = get_schema_plan(fields)
+    writer = OUTPUT_FORMATS[fmt][1]
+    records = 0
+    bytes_written = 0
+
+    def counted(batches):
+        nonlocal records
+        for size, columns in batches:
+            records += size
+            yield size, columns
+
+    for chunk in writer(counted(iter_columns(plan, count, seed, offset, workers)), plan.keys):
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        out.write(chunk)
+        bytes_written += len(chunk)
+        if progress:
+            progress(records, bytes_written)
+    if progress:
+        progress(records, bytes_written, final=True)
+    return records, bytes_written
+
+def run_export(argv):
+    from OutputFormats import format_available
+    parser = build_export_parser()
+    args = parser.parse_args(argv)
+    if args.offset < 0:
+        parser.error("--offset must be 0 or more")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    try:
+        fields, schema_count = load_schema_file(args.schema)
+        plan = compile_schema(fields, strict=True)
+    except (OSError, ValueError) as e:
+        parser.error(f"could not load schema: {e}")
+    count = args.count if args.count is not None else schema_count
+    if not isinstance(count, int) or count < 1:
+        parser.error("give --count or a positive 'count' in the schema file")
+    if not format_available(args.format):
+        parser.error(f"format '{args.format}' needs an optional package that is not installed")
+    compression = args.compress
+    if compression is None:
+        compression = next((name for ext, name in EXPORT_COMPRESSION_EXTENSIONS.items() if args.output.endswith(ext)), "none")
+
+    try:
+        check_unique_capacity(plan, args.offset + count)
+        check_references(plan, None)
+        out, raw = open_export_output(args.output, compression, args.level)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    try:
+        progress = make_progress_reporter(count) if args.progress else None
+        export_data(plan, count, out, args.format, args.seed, args.offset, args.workers, progress)
+    finally:
+        if out is not raw:
+            out.close()
+        if raw is sys.stdout.buffer:
+            raw.flush()
+        else:
+            raw.close()
+
+## Main CLI flow for generating random data - any arguments switch to the non-interactive export ##
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        run_export(argv)
+        return
 
-## Main CLI flow for generating random data ##
-def main():
+    init_cli_colours()
     print(Fore.LIGHTRED_EX + "\nRandom Data Generator - By Rajeen K\n" + Style.RESET_ALL)
 
     while True:
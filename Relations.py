@@ -0,0 +1,92 @@
+## Related Schemas By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+from array import array
+from RandomDataGenerator import iter_columns, get_plan_references, check_unique_capacity
+from Uniqueness import stable_key
+
+###########################################
+
+## A batch is several schemas generated together, parents before children, so foreign keys ##
+## can be sampled from the keys the parent actually produced ##
+
+## The values of one parent field, kept as a packed array of 64-bit ints (8 bytes a key) ##
+## Falls back to a list the first time a value does not fit, e.g. string keys ##
+class ParentKeyIndex:
+    def __init__(self):
+        self.keys = array("q")
+
+    def extend(self, values):
+        if isinstance(self.keys, array):
+            length = len(self.keys)
+            try:
+                self.keys.extend(values)
+                return
+            except (TypeError, OverflowError):
+                del self.keys[length:]
+                self.keys = list(self.keys)
+        self.keys.extend(values)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, index):
+        return self.keys[index]
+
+
+## Order schemas so every parent comes before its children, keeping the requested order otherwise ##
+## plans is {name: SchemaPlan}; raises ValueError for a parent outside the batch, an unknown field or a cycle ##
+def order_schemas(plans):
+    parents = {}
+    for name, plan in plans.items():
+        parents[name] = set()
+        for field, (schema, key_field) in get_plan_references(plan).items():
+            if schema not in plans:
+                raise ValueError(f"Schema '{name}' field '{field}' references schema '{schema}', which is not in this batch.")
+            if key_field not in plans[schema].keys:
+                raise ValueError(f"Schema '{name}' field '{field}' references '{schema}.{key_field}', which does not exist.")
+            parents[name].add(schema)
+
+    ordered = []
+    remaining = list(plans)
+    while remaining:
+        ready = next((name for name in remaining if parents[name].issubset(ordered)), None)
+        if ready is None:
+            raise ValueError(f"Foreign keys form a cycle between schemas: {', '.join(remaining)}.")
+        ordered.append(ready)
+        remaining.remove(ready)
+    return ordered
+
+## Each schema in a seeded batch gets its own seed, so same-typed fields in different schemas differ ##
+def get_schema_seed(seed, name):
+    return None if seed is None else stable_key(f"{seed}:{name}") >> 1
+
+## Check counts against unique fields and order the batch - entries is [(name, plan, count)] ##
+def prepare_batch(entries):
+    plans = {name: plan for name, plan, _ in entries}
+    counts = {name: count for name, _, count in entries}
+    for name, plan, count in entries:
+        check_unique_capacity(plan, count)
+    return [(name, plans[name], counts[name]) for name in order_schemas(plans)]
+
+## Yield (name, plan, column batches) for each schema of a prepared batch, in order ##
+## Consume each schema's batches before moving to the next - only the referenced parent fields are ##
+## kept (in ParentKeyIndex), never the parent records ##
+def iter_batch(entries, seed=None, workers=1):
+    indexes = {}
+    for _, plan, _ in entries:
+        for reference in get_plan_references(plan).values():
+            indexes.setdefault(reference, ParentKeyIndex())
+
+    for name, plan, count in entries:
+        ## Parents are complete by now, so children sample the packed keys directly ##
+        references = {field: indexes[reference].keys for field, reference in get_plan_references(plan).items()}
+        collected = [(key_field, index) for (schema, key_field), index in indexes.items() if schema == name]
+        yield name, plan, iter_collecting(iter_columns(plan, count, get_schema_seed(seed, name), 0, workers, references), collected)
+
+## Pass column batches through while copying the referenced fields into their indexes ##
+def iter_collecting(batches, collected):
+    for size, columns in batches:
+        for key_field, index in collected:
+            index.extend(columns[key_field])
+        yield size, columns
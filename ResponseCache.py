@@ -0,0 +1,83 @@
+## Response Cache By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import hashlib
+import threading
+from collections import OrderedDict
+
+###########################################
+
+## In-process cache of serialized responses, bounded by total bytes with LRU eviction ##
+## Only deterministic (seeded) responses belong here - the key must fully identify the payload ##
+class ResponseCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def get(self, key):
+        with self.lock:
+            body = self.entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        if len(body) > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes_held -= len(old)
+            self.entries[key] = body
+            self.bytes_held += len(body)
+            while self.bytes_held > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.bytes_held -= len(evicted)
+                self.evictions += 1
+
+    ## Pass chunks through to the client, storing the full body once the stream completes ##
+    ## A stream larger than max_bytes, or one the client abandons, is never stored ##
+    def capture(self, key, chunks):
+        parts = []
+        size = 0
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            if parts is not None:
+                size += len(chunk)
+                if size > self.max_bytes:
+                    parts = None
+                else:
+                    parts.append(chunk)
+            yield chunk
+        if parts is not None:
+            self.put(key, b"".join(parts))
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes_held": self.bytes_held,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+
+## Strong ETag derived from the cache key, so it is known before any data is generated ##
+def make_etag(key):
+    return hashlib.sha1(repr(key).encode()).hexdigest()
@@ -0,0 +1,129 @@
+## Schema Store By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+###########################################
+
+## Stores schemas as {"fields", "count", "version", "digest", "plan"} entries - plan is built by compile_fields ##
+## version is a store-local change counter that restarts with the store, so anything that must identify ##
+## a schema's content across restarts (ETags, cache keys) uses digest instead ##
+
+## Stable digest of a schema's stored fields and count ##
+def schema_digest(fields, count):
+    payload = json.dumps({"fields": fields, "count": count}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+## Single-process store - schemas live in a dict and vanish on restart ##
+class MemorySchemaStore:
+    def __init__(self, compile_fields):
+        self.compile_fields = compile_fields
+        self.entries = {}
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def put(self, name, fields, count):
+        plan = self.compile_fields(fields)
+        with self.lock:
+            self.version += 1
+            self.entries[name] = {
+                "fields": fields, "count": count, "version": self.version, "digest": schema_digest(fields, count), "plan": plan
+            }
+
+    def get(self, name):
+        return self.entries.get(name)
+
+    def names(self):
+        return list(self.entries.keys())
+
+
+## SQLite store shared by every gunicorn worker and kept across restarts ##
+## Each worker keeps a local read-through cache, dropped whenever the global version counter moves ##
+class SQLiteSchemaStore:
+    def __init__(self, path, compile_fields):
+        self.path = path
+        self.compile_fields = compile_fields
+        self.local = threading.local()
+        self.cache = {}
+        self.cache_version = None
+        self.cache_lock = threading.Lock()
+
+        with _Transaction(self.connect()) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS schemas (name TEXT PRIMARY KEY, fields TEXT NOT NULL, count INTEGER NOT NULL, version INTEGER NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO meta (id, version) VALUES (1, 0)")
+
+    ## One connection per thread and per process, so forked workers never share a handle ##
+    def connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def current_version(self):
+        return self.connect().execute("SELECT version FROM meta WHERE id = 1").fetchone()[0]
+
+    def put(self, name, fields, count):
+        with _Transaction(self.connect()) as conn:
+            conn.execute("UPDATE meta SET version = version + 1 WHERE id = 1")
+            version = conn.execute("SELECT version FROM meta WHERE id = 1").fetchone()[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO schemas (name, fields, count, version) VALUES (?, ?, ?, ?)",
+                (name, json.dumps(fields), count, version)
+            )
+
+    def get(self, name):
+        version = self.current_version()
+        with self.cache_lock:
+            if version != self.cache_version:
+                self.cache = {}
+                self.cache_version = version
+            entry = self.cache.get(name)
+        if entry is not None:
+            return entry
+
+        row = self.connect().execute("SELECT fields, count, version FROM schemas WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+
+        fields = json.loads(row[0])
+        entry = {
+            "fields": fields, "count": row[1], "version": row[2], "digest": schema_digest(fields, row[1]), "plan": self.compile_fields(fields)
+        }
+        with self.cache_lock:
+            if self.cache_version == version:
+                self.cache[name] = entry
+        return entry
+
+    def names(self):
+        return [row[0] for row in self.connect().execute("SELECT name FROM schemas ORDER BY rowid")]
+
+
+## Wraps writes in an immediate transaction so the version bump and the schema row commit together ##
+class _Transaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+## Build the store named by RDG_SCHEMA_STORE: "memory" (default) or "sqlite:///<path>" (e.g. sqlite:////data/schemas.db) ##
+def create_schema_store(url, compile_fields):
+    if not url or url == "memory":
+        return MemorySchemaStore(compile_fields)
+    if url.startswith("sqlite:///"):
+        return SQLiteSchemaStore(url[len("sqlite:///"):], compile_fields)
+    raise ValueError(f"Unknown schema store: {url}")
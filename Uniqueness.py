@@ -0,0 +1,104 @@
+## Uniqueness By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import hashlib
+import math
+
+###########################################
+
+MASK_64 = (1 << 64) - 1
+
+## Derive a stable 64-bit key from any string - hash() is salted per process, so it cannot be shared with workers ##
+def stable_key(text):
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+## Keyed pseudo-random permutation of range(size) - index -> value in O(1) memory ##
+## A balanced Feistel network over the next even power of two, cycle-walking until the value lands inside the range ##
+class FeistelPermutation:
+    def __init__(self, size, key, rounds=4):
+        if size < 1:
+            raise ValueError("Permutation size must be at least 1.")
+        bits = max(2, (size - 1).bit_length())
+        bits += bits % 2
+        self.size = size
+        self.half_bits = bits // 2
+        self.half_mask = (1 << self.half_bits) - 1
+        self.round_keys = [stable_key(f"{key}:{round_index}") for round_index in range(rounds)]
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        half_bits = self.half_bits
+        half_mask = self.half_mask
+        value = index
+        while True:
+            left, right = value >> half_bits, value & half_mask
+            for round_key in self.round_keys:
+                mixed = ((right ^ round_key) * 0x9E3779B97F4A7C15) & MASK_64
+                mixed ^= mixed >> 29
+                left, right = right, left ^ (mixed & half_mask)
+            value = (left << half_bits) | right
+            if value < self.size:
+                return value
+
+
+## Fixed-size Bloom filter - add() returns False when the value was (probably) added before ##
+class BloomFilter:
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.size_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.size_bits + 7) // 8)
+        self.count = 0
+
+    def positions(self, first, second):
+        size_bits = self.size_bits
+        return [(first + i * second) % size_bits for i in range(self.hash_count)]
+
+    def contains(self, positions):
+        bits = self.bits
+        for position in positions:
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def insert(self, positions):
+        bits = self.bits
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+
+## Bloom filter that grows by adding larger, tighter filters as it fills ##
+## Its shape depends only on how many values were added, never on the requested count, so seeded runs stay reproducible ##
+## A false positive only makes the caller draw another value - it can never let a duplicate through ##
+class ScalableBloomFilter:
+    def __init__(self, initial_capacity=65536, error_rate=0.001, growth=2, tightening=0.5):
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters = [BloomFilter(initial_capacity, error_rate * tightening)]
+
+    def add(self, value):
+        digest = hashlib.blake2b(str(value).encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        positions = None
+        for bloom in self.filters:
+            positions = bloom.positions(first, second)
+            if bloom.contains(positions):
+                return False
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            error_rate = self.error_rate * self.tightening ** (len(self.filters) + 1)
+            current = BloomFilter(current.capacity * self.growth, error_rate)
+            self.filters.append(current)
+            positions = current.positions(first, second)
+        current.insert(positions)
+        return True
+
+    def memory_bytes(self):
+        return sum(len(bloom.bits) for bloom in self.filters)
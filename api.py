@@ -1,16 +1,102 @@
 ## API By Rajeen Kaleerathan  ##
 
 ## Imported ##
-from flask import Flask, request, jsonify, Response
-from RandomDataGenerator import generate_data
-import json
+from flask import Flask, request, jsonify, Response, g
+from flask.json.provider import DefaultJSONProvider
+from RandomDataGenerator import iter_columns, compile_schema, enable_value_pools, get_pool_stats, get_generation_timings, warm_up, check_unique_capacity, get_plan_references
+from SchemaStore import create_schema_store
+from ResponseCache import ResponseCache, make_etag
+from OutputFormats import OUTPUT_FORMATS, FORMAT_MIMETYPES, BATCH_FORMATS, format_available
+from Relations import prepare_batch, iter_batch
+from Metrics import create_metrics, render_prometheus
+from Profiler import ProfileStore
+from Compression import available_encodings, compress_body, compress_stream, peek_stream, chain_chunks
+import JsonSerializer
+from datetime import date
+import os
+import time
 
 ####################
 
+## Route jsonify through the shared serializer (orjson when installed) ##
+class SerializerJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        return JsonSerializer.dumps(obj).decode()
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(JsonSerializer.dumps(obj) + b"\n", mimetype=self.mimetype)
+
 app = Flask(__name__)
+app.json = SerializerJSONProvider(app)
+
+## Schema storage - in memory by default; RDG_SCHEMA_STORE=sqlite:///<path> shares schemas across gunicorn workers ##
+schemas = create_schema_store(os.environ.get("RDG_SCHEMA_STORE", "memory"), compile_schema)
+
+## Worker processes for large data requests - RDG_GENERATION_WORKERS=1 (default) keeps generation in-process ##
+generation_workers = int(os.environ.get("RDG_GENERATION_WORKERS", "1"))
+
+## Cache for seeded (reproducible) data responses - RDG_RESPONSE_CACHE_BYTES=0 disables it ##
+response_cache = ResponseCache(int(os.environ.get("RDG_RESPONSE_CACHE_BYTES", str(64 * 1024 * 1024))))
+
+## Request and generation metrics - set RDG_METRICS_DIR when running several gunicorn workers so /metrics sums them all ##
+metrics = create_metrics(os.environ.get("RDG_METRICS_DIR"), get_generation_timings)
+
+## Response compression - RDG_COMPRESSION_ENCODINGS lists the encodings to offer in preference order ("" disables) ##
+## Bodies under RDG_COMPRESSION_MIN_BYTES are sent as they are ##
+compression_encodings = available_encodings(
+    [name.strip() for name in os.environ.get("RDG_COMPRESSION_ENCODINGS", "zstd,gzip").split(",") if name.strip()]
+)
+compression_levels = {
+    "gzip": int(os.environ.get("RDG_GZIP_LEVEL", "6")),
+    "zstd": int(os.environ.get("RDG_ZSTD_LEVEL", "3"))
+}
+compression_min_bytes = int(os.environ.get("RDG_COMPRESSION_MIN_BYTES", "1024"))
+
+## Opt-in profiling - RDG_PROFILING=1 lets data requests ask for ?profile=1 (or an X-RDG-Profile: 1 header) ##
+## Disabled by default, in which case the parameter is ignored and nothing is profiled ##
+profiles = None
+if os.environ.get("RDG_PROFILING") == "1":
+    profiles = ProfileStore(
+        keep=int(os.environ.get("RDG_PROFILE_KEEP", "10")),
+        top=int(os.environ.get("RDG_PROFILE_TOP", "25"))
+    )
+
+## Optional value pools for expensive Faker types - RDG_VALUE_POOL_SIZE=0 (default) disables them ##
+pool_size = int(os.environ.get("RDG_VALUE_POOL_SIZE", "0"))
+if pool_size > 0:
+    enable_value_pools(
+        size=pool_size,
+        refresh_interval=float(os.environ.get("RDG_VALUE_POOL_REFRESH_SECONDS", "1.0")),
+        refresh_fraction=float(os.environ.get("RDG_VALUE_POOL_REFRESH_FRACTION", "0.1")),
+        eviction=os.environ.get("RDG_VALUE_POOL_EVICTION", "random")
+    )
+
+## RDG_WARM_UP=1 loads Faker and every provider at import - with gunicorn --preload the master does this once ##
+## and every worker forks already initialised; otherwise the first request that needs Faker pays for it ##
+if os.environ.get("RDG_WARM_UP") == "1":
+    warm_up()
+
+####################
 
-## In-memory schema storage ##
-schemas = {}
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+## Latency is recorded when the response closes, so streamed bodies are timed until their last byte ##
+@app.after_request
+def record_request_metrics(response):
+    endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+    method = request.method
+    started = g.request_started
+    if response.is_streamed:
+        response.response = metrics.count_bytes(endpoint, response.response)
+    else:
+        metrics.add_bytes(endpoint, response.content_length or 0)
+    response.call_on_close(
+        lambda: metrics.observe_request(endpoint, method, response.status_code, time.perf_counter() - started)
+    )
+    return response
 
 ####################
 
@@ -25,7 +111,7 @@ def health():
 
 ####################
 
-## POST /schemas - Create and store a schema in memory ##
+## POST /schemas - Create and store a schema ##
 @app.route("/schemas", methods=["POST"])
 def create_schema():
     data = request.get_json()
@@ -38,10 +124,13 @@ def create_schema():
             "error": "Invalid input. Must include 'name', 'fields' (dict), and 'count' (int)."
         }), 400
 
-    schemas[name] = {
-        "fields": fields,
-        "count": count
-    }
+    ## Reject unknown data types up front - the store keeps a compiled plan for data requests ##
+    try:
+        check_unique_capacity(compile_schema(fields, strict=True), count)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid input. {e}"}), 400
+
+    schemas.put(name, fields, count)
 
     return jsonify({
         "message": f"Schema '{name}' created successfully."
@@ -49,6 +138,61 @@ def create_schema():
 
 ####################
 
+## Pick the output format from the Accept header - JSON unless another supported type is preferred ##
+def negotiate_format():
+    best = request.accept_mimetypes.best_match(list(FORMAT_MIMETYPES), default="application/json")
+    return FORMAT_MIMETYPES[best]
+
+## Read an optional integer query parameter, enforcing a lower bound when one is given ##
+def get_int_arg(name, default, minimum=None):
+    raw_value = request.args.get(name)
+    if raw_value is None:
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError:
+        raise ValueError(f"'{name}' must be an integer.")
+    if minimum is not None and value < minimum:
+        raise ValueError(f"'{name}' must be at least {minimum}.")
+    return value
+
+## Pick a content encoding from Accept-Encoding - None means send the body uncompressed ##
+def negotiate_encoding():
+    if not compression_encodings:
+        return None
+    return request.accept_encodings.best_match(compression_encodings)
+
+## Compress a whole body or a chunk stream - returns (body, encoding applied or None) ##
+## A stream is peeked until min_bytes are buffered, so small responses go out uncompressed ##
+def compress_response(body, encoding):
+    if encoding is None:
+        return body, None
+    level = compression_levels[encoding]
+    if isinstance(body, bytes):
+        if len(body) < compression_min_bytes:
+            return body, None
+        return compress_body(body, encoding, level), encoding
+    head, rest, ended = peek_stream(body, compression_min_bytes)
+    if ended:
+        return b"".join(head), None
+    return compress_stream(chain_chunks(head, rest), encoding, level), encoding
+
+## Each encoding is a different representation, so it gets its own strong ETag ##
+def representation_etag(etag, encoding):
+    return f"{etag}-{encoding}" if encoding else etag
+
+## Resolve count/seed/offset/limit - count sizes the logical dataset, offset/limit page through it ##
+def get_requested_range(schema):
+    count = get_int_arg("count", schema["count"], 1)
+    seed = get_int_arg("seed", None)
+    offset = get_int_arg("offset", 0, 0)
+    limit = get_int_arg("limit", None, 1)
+
+    size = max(0, count - offset)
+    if limit is not None:
+        size = min(size, limit)
+    return seed, offset, size
+
 ## GET /schemas/<name>/data - Generate data using saved schema ##
 @app.route("/schemas/<name>/data", methods=["GET"])
 def get_schema_data(name):
@@ -57,23 +201,172 @@ def get_schema_data(name):
     if not schema:
         return jsonify({"error": f"Schema '{name}' not found."}), 404
 
-    ## Pass raw fields (which map field → data_type) to the generator
-    data = generate_data(schema["fields"], schema["count"])
+    if get_plan_references(schema["plan"]):
+        return jsonify({
+            "error": f"Schema '{name}' has foreign keys. Request it with its parent schemas through POST /batches."
+        }), 400
+
+    try:
+        seed, offset, size = get_requested_range(schema)
+        check_unique_capacity(schema["plan"], offset + size)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid input. {e}"}), 400
 
-    accept_header = request.headers.get("Accept", "application/json").lower()
+    fmt = negotiate_format()
+    mimetype, writer, _ = OUTPUT_FORMATS[fmt]
+    if not format_available(fmt):
+        return jsonify({"error": f"Format '{mimetype}' is not available on this server."}), 406
 
-    if "application/x-ndjson" in accept_header:
-        ndjson_output = "\n".join(json.dumps(record) for record in data)
-        return Response(ndjson_output, mimetype="application/x-ndjson")
+    if profiles is not None:
+        profile_mode = request.args.get("profile") or request.headers.get("X-RDG-Profile")
+        if profile_mode in ("1", "report"):
+            response = profile_schema_data(name, schema, seed, offset, size, fmt, profile_mode)
+            if response is not None:
+                return response
 
-    return jsonify(data)
+    encoding = negotiate_encoding()
+
+    ## Seeded responses are reproducible, so they get an ETag and can be served from the cache ##
+    ## date_iso is relative to today, so the day is part of the key ##
+    ## The schema digest (not the store's version counter, which restarts) ties the key to the schema's content ##
+    ## The cache holds the uncompressed body, so one entry serves every encoding ##
+    cache_key = etag = body = None
+    if seed is not None:
+        cache_key = (name, schema["digest"], seed, offset, size, fmt, date.today().isoformat())
+        etag = make_etag(cache_key)
+        for candidate in (etag, representation_etag(etag, encoding)):
+            if request.if_none_match.contains(candidate):
+                not_modified = Response(status=304)
+                not_modified.set_etag(candidate)
+                return not_modified
+        body = response_cache.get(cache_key) if response_cache.enabled() else None
+
+    ## Column batches are generated lazily and encoded (and compressed) while the response is being sent ##
+    if body is None:
+        batches = iter_columns(schema["plan"], size, seed=seed, offset=offset, workers=generation_workers)
+        body = writer(batches, schema["plan"].keys)
+        if cache_key is not None and response_cache.enabled():
+            body = response_cache.capture(cache_key, body)
+
+    body, applied_encoding = compress_response(body, encoding)
+    metrics.add_records(request.url_rule.rule, size)
+    response = Response(body, mimetype=mimetype)
+    if compression_encodings:
+        response.vary.add("Accept-Encoding")
+    if applied_encoding:
+        response.headers["Content-Encoding"] = applied_encoding
+    if etag:
+        response.set_etag(representation_etag(etag, applied_encoding))
+    return response
+
+## Generate and encode the whole response under the profiler, bypassing the ETag and response cache ##
+## profile=1 returns the data with an X-RDG-Profile-Id header, profile=report returns the hotspots instead ##
+## Returns None when another request is already being profiled, so the caller serves it normally ##
+def profile_schema_data(name, schema, seed, offset, size, fmt, profile_mode):
+    mimetype, writer, _ = OUTPUT_FORMATS[fmt]
+
+    def render():
+        batches = iter_columns(schema["plan"], size, seed=seed, offset=offset, workers=generation_workers)
+        return b"".join(chunk.encode() if isinstance(chunk, str) else chunk for chunk in writer(batches, schema["plan"].keys))
+
+    body, report = profiles.run(render, schema=name, records=size, format=fmt, seed=seed, offset=offset)
+    if report is None:
+        return None
+    metrics.add_records(request.url_rule.rule, size)
+    if profile_mode == "report":
+        return jsonify(report)
+    response = Response(body, mimetype=mimetype)
+    response.headers["X-RDG-Profile-Id"] = str(report["id"])
+    return response
+
+####################
+
+## POST /batches - Generate several stored schemas in one streamed response ##
+## Body: {"schemas": [names...], "seed": optional int, "counts": optional {name: count}} ##
+## Parents are generated before their children so foreign keys sample real parent keys ##
+@app.route("/batches", methods=["POST"])
+def generate_batch():
+    data = request.get_json(silent=True) or {}
+    names = data.get("schemas")
+    seed = data.get("seed")
+    counts = data.get("counts", {})
+
+    if not (isinstance(names, list) and names and all(isinstance(item, str) for item in names)) \
+            or not (seed is None or isinstance(seed, int)) or not isinstance(counts, dict):
+        return jsonify({
+            "error": "Invalid input. Must include 'schemas' (list of names), with optional 'seed' (int) and 'counts' (dict)."
+        }), 400
+
+    entries = []
+    for schema_name in dict.fromkeys(names):
+        schema = schemas.get(schema_name)
+        if not schema:
+            return jsonify({"error": f"Schema '{schema_name}' not found."}), 404
+        count = counts.get(schema_name, schema["count"])
+        if not isinstance(count, int) or count < 1:
+            return jsonify({"error": f"Invalid input. Count for '{schema_name}' must be a positive integer."}), 400
+        entries.append((schema_name, schema["plan"], count))
+
+    try:
+        entries = prepare_batch(entries)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid input. {e}"}), 400
+
+    best = request.accept_mimetypes.best_match(["application/json", "application/x-ndjson"], default="application/json")
+    fmt = FORMAT_MIMETYPES[best]
+    schema_batches = (
+        (schema_name, plan.keys, batches)
+        for schema_name, plan, batches in iter_batch(entries, seed, generation_workers)
+    )
+    body, applied_encoding = compress_response(BATCH_FORMATS[fmt](schema_batches), negotiate_encoding())
+
+    metrics.add_records(request.url_rule.rule, sum(count for _, _, count in entries))
+    response = Response(body, mimetype=best)
+    if compression_encodings:
+        response.vary.add("Accept-Encoding")
+    if applied_encoding:
+        response.headers["Content-Encoding"] = applied_encoding
+    return response
 
 ####################
 
 ## GET /schemas - List all schema names ##
 @app.route("/schemas", methods=["GET"])
 def list_schemas():
-    return jsonify(list(schemas.keys()))
+    return jsonify(schemas.names())
+
+####################
+
+## GET /pools - Value pool hit/miss counters ##
+@app.route("/pools", methods=["GET"])
+def pool_stats():
+    return jsonify(get_pool_stats())
+
+## GET /cache - Response cache hit ratio and bytes held ##
+@app.route("/cache", methods=["GET"])
+def cache_stats():
+    return jsonify(response_cache.stats())
+
+## GET /profiles - The slowest profiled requests kept in memory, slowest first ##
+@app.route("/profiles", methods=["GET"])
+def list_profiles():
+    if profiles is None:
+        return jsonify({"error": "Profiling is disabled. Set RDG_PROFILING=1 to enable it."}), 404
+    return jsonify(profiles.summaries())
+
+## GET /profiles/<id> - One stored profile with its hotspots ##
+@app.route("/profiles/<int:profile_id>", methods=["GET"])
+def get_profile(profile_id):
+    report = profiles.get(profile_id) if profiles is not None else None
+    if report is None:
+        return jsonify({"error": f"Profile '{profile_id}' not found."}), 404
+    return jsonify(report)
+
+## GET /metrics - Prometheus text exposition of request, generation and schema metrics ##
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    gauges = {"rdg_schemas": len(schemas.names())}
+    return Response(render_prometheus(metrics.collect(), gauges), mimetype="text/plain; version=0.0.4")
 
 ####################
 
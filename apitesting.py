@@ -101,3 +101,94 @@ def test_create_schema_missing_fields(api):
     res = api.post("/schemas", data=json.dumps(schema))
     assert res.status == 400
     assert "Invalid input" in res.json()["error"]
+
+## Test that ?count= overrides the stored schema count ##
+def test_run_schema_count_override(api, created_schema):
+    res = api.get(f"/schemas/{created_schema}/data?count=5")
+    assert res.status == 200
+    assert len(res.json()) == 5
+
+## Test streamed NDJSON honours the count override ##
+def test_run_schema_ndjson_count_override(api, created_schema):
+    headers = {"Accept": "application/x-ndjson"}
+    res = api.get(f"/schemas/{created_schema}/data?count=1200", headers=headers)
+    assert res.status == 200
+    lines = res.text().strip().split("\n")
+    assert len(lines) == 1200
+    assert all(json.loads(line)["email"] for line in lines)
+
+## Test an invalid count override is rejected ##
+def test_run_schema_invalid_count_override(api, created_schema):
+    res = api.get(f"/schemas/{created_schema}/data?count=zero")
+    assert res.status == 400
+    assert "Invalid input" in res.json()["error"]
+
+## Test schema creation with an unknown data type is rejected up front ##
+def test_create_schema_with_unknown_data_type(api):
+    schema = {
+        "name": "unknownType",
+        "fields": {
+            "name": "not_real_type"
+        },
+        "count": 1
+    }
+    res = api.post("/schemas", data=json.dumps(schema))
+    assert res.status == 400
+    assert "Unknown data type" in res.json()["error"]
+
+## Test a seeded page matches the same slice of the full seeded dataset ##
+def test_run_schema_seeded_pagination(api, created_schema):
+    full = api.get(f"/schemas/{created_schema}/data?seed=7&count=50").json()
+    page = api.get(f"/schemas/{created_schema}/data?seed=7&count=50&offset=20&limit=10").json()
+    assert page == full[20:30]
+
+## Test seeded responses carry an ETag and answer conditional requests with 304 ##
+def test_run_schema_seeded_etag(api, created_schema):
+    res = api.get(f"/schemas/{created_schema}/data?seed=11")
+    assert res.status == 200
+    etag = res.headers["etag"]
+    again = api.get(f"/schemas/{created_schema}/data?seed=11", headers={"If-None-Match": etag})
+    assert again.status == 304
+
+## Test CSV output via content negotiation ##
+def test_run_schema_csv_response(api, created_schema):
+    res = api.get(f"/schemas/{created_schema}/data", headers={"Accept": "text/csv"})
+    assert res.status == 200
+    lines = res.text().strip().splitlines()
+    assert lines[0] == "name,email"
+    assert len(lines) == 3
+
+## Test compact rows JSON output via content negotiation ##
+def test_run_schema_json_rows_response(api, created_schema):
+    res = api.get(f"/schemas/{created_schema}/data", headers={"Accept": "application/vnd.rdg.rows+json"})
+    assert res.status == 200
+    data = res.json()
+    assert data["fields"] == ["name", "email"]
+    assert len(data["rows"]) == 2
+
+## Test a unique field with too few distinct values is rejected up front ##
+def test_create_schema_unique_capacity(api):
+    schema = {
+        "name": "unique_flags",
+        "fields": {"flag": {"type": "boolean", "unique": True}},
+        "count": 3
+    }
+    res = api.post("/schemas", data=json.dumps(schema))
+    assert res.status == 400
+
+## Test a batch generates parents first and child foreign keys point at parent keys ##
+def test_batch_with_foreign_keys(api):
+    parent = {"name": "batch_customers", "fields": {"CustomerId": {"type": "id_number", "unique": True}}, "count": 5}
+    child = {
+        "name": "batch_orders",
+        "fields": {"CustomerId": {"type": "foreign_key", "schema": "batch_customers", "field": "CustomerId"}},
+        "count": 20
+    }
+    api.post("/schemas", data=json.dumps(parent))
+    api.post("/schemas", data=json.dumps(child))
+    res = api.post("/batches", data=json.dumps({"schemas": ["batch_orders", "batch_customers"], "seed": 1}))
+    assert res.status == 200
+    data = res.json()
+    customer_ids = {record["CustomerId"] for record in data["batch_customers"]}
+    assert len(data["batch_orders"]) == 20
+    assert all(record["CustomerId"] in customer_ids for record in data["batch_orders"])
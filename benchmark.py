@@ -0,0 +1,235 @@
+## Benchmarks By Rajeen Kaleerathan  ##
+
+## Imported Libraries ##
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import JsonSerializer
+from RandomDataGenerator import (
+    generate_data, generate_columns, available_data_types, batch_data_types, localized_batch_data_types,
+    default_context, get_locale_faker, LOCALE_CALLING_CODES
+)
+
+###########################################
+
+## Every benchmark returns a flat {metric name: value} dict. Names ending in _per_sec are ##
+## higher-is-better; everything else (seconds, ms, bytes) is lower-is-better ##
+
+ALL_FIELDS = {field_type: field_type for field_type in available_data_types}
+
+## Time fn over repeat runs and return the best wall-clock seconds ##
+def best_time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+## Values/sec for every data type, generated as a single column ##
+def bench_data_types(count=2000):
+    results = {}
+    for dtype in available_data_types:
+        seconds = best_time(lambda: generate_columns({"field": dtype}, count))
+        results[f"data_type.{dtype}.values_per_sec"] = count / seconds
+    return results
+
+## generate_data records/sec across schema widths and record counts ##
+def bench_generate_scaling(field_counts=(1, 5, 14), record_counts=(1000, 5000)):
+    results = {}
+    names = list(available_data_types)
+    for field_count in field_counts:
+        fields = {name: name for name in names[:field_count]}
+        for count in record_counts:
+            seconds = best_time(lambda: generate_data(fields, count), repeat=1)
+            results[f"generate_data.fields_{field_count}.records_{count}.records_per_sec"] = count / seconds
+    return results
+
+## Peak traced memory for building the full list vs streaming the same records through the API ##
+def bench_memory(count=10000):
+    from api import app
+    client = app.test_client()
+    client.post("/schemas", json={"name": "bench_memory", "fields": ALL_FIELDS, "count": count})
+    results = {}
+
+    tracemalloc.start()
+    generate_data(ALL_FIELDS, count)
+    results[f"memory.generate_data.records_{count}.peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    for fmt, accept in (("json", "application/json"), ("ndjson", "application/x-ndjson")):
+        tracemalloc.start()
+        response = client.get("/schemas/bench_memory/data", headers={"Accept": accept}, buffered=False)
+        for _ in response.response:
+            pass
+        response.close()
+        results[f"memory.api_{fmt}.records_{count}.peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return results
+
+## In-process Flask latency (small pulls) and throughput (large pulls) through the test client ##
+def bench_api(requests=50, small_count=10, large_count=5000):
+    from api import app
+    client = app.test_client()
+    client.post("/schemas", json={"name": "bench_api", "fields": ALL_FIELDS, "count": small_count})
+    results = {}
+
+    for fmt, accept in (("json", "application/json"), ("ndjson", "application/x-ndjson")):
+        latencies = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.get("/schemas/bench_api/data", headers={"Accept": accept}).get_data()
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        results[f"api_{fmt}.records_{small_count}.p50_ms"] = statistics.median(latencies)
+        results[f"api_{fmt}.records_{small_count}.p95_ms"] = latencies[int(len(latencies) * 0.95) - 1]
+
+        seconds = best_time(lambda: client.get(f"/schemas/bench_api/data?count={large_count}", headers={"Accept": accept}).get_data(), repeat=1)
+        results[f"api_{fmt}.records_{large_count}.records_per_sec"] = large_count / seconds
+    return results
+
+## Bytes on the wire and compression throughput for every output format and content encoding ##
+def bench_compression(count=5000):
+    from OutputFormats import OUTPUT_FORMATS, format_available
+    from Compression import ENCODINGS, available_encodings, compress_stream
+    from RandomDataGenerator import compile_schema, iter_columns
+    plan = compile_schema(ALL_FIELDS)
+    batches = list(iter_columns(plan, count, seed=1))
+    results = {}
+    for fmt, (_, writer, _) in OUTPUT_FORMATS.items():
+        if not format_available(fmt):
+            continue
+        chunks = [chunk.encode() if isinstance(chunk, str) else chunk for chunk in writer(iter(batches), plan.keys)]
+        raw_bytes = sum(map(len, chunks))
+        results[f"compression.{fmt}.identity.wire_bytes"] = raw_bytes
+        for encoding in available_encodings(ENCODINGS):
+            wire_bytes = sum(map(len, compress_stream(chunks, encoding)))
+            seconds = best_time(lambda: sum(map(len, compress_stream(chunks, encoding))))
+            results[f"compression.{fmt}.{encoding}.wire_bytes"] = wire_bytes
+            results[f"compression.{fmt}.{encoding}.mb_per_sec"] = raw_bytes / seconds / 1e6
+    return results
+
+## Cold import time of the generator and the API in a fresh interpreter, and the cost of warm_up() ##
+def bench_startup(repeat=3):
+    results = {}
+    for module in ("RandomDataGenerator", "api"):
+        code = f"import time; started = time.perf_counter(); import {module}; print(time.perf_counter() - started)"
+        seconds = min(
+            float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+            for _ in range(repeat)
+        )
+        results[f"startup.import_{module}.seconds"] = seconds
+    code = "import time, RandomDataGenerator; started = time.perf_counter(); RandomDataGenerator.warm_up(); print(time.perf_counter() - started)"
+    results["startup.warm_up.seconds"] = float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+    return results
+
+## Encode throughput (records/sec and MB/sec) of every installed JSON backend ##
+def bench_json_backends(count=20000):
+    records = generate_data(ALL_FIELDS, count, seed=1)
+    results = {}
+    for name in JsonSerializer.available_backends():
+        dumps, dumps_lines = JsonSerializer.load_backend(name)
+        payload_bytes = len(dumps_lines(records))
+        seconds = best_time(lambda: dumps_lines(records))
+        results[f"json_encode.{name}.records_per_sec"] = count / seconds
+        results[f"json_encode.{name}.mb_per_sec"] = payload_bytes / seconds / 1e6
+    return results
+
+## The per-value Faker implementations the phone and date lookup tables replaced, kept for comparison ##
+## Schemas generate phone fields per locale, so the phone baselines are the old localized functions ##
+def faker_phone_strings(n, locale, code):
+    msisdn = get_locale_faker(locale).msisdn
+    calling_code = LOCALE_CALLING_CODES[code]
+    phones = []
+    for _ in range(n):
+        number = msisdn()[3:13]
+        phones.append(f"({calling_code}) {number[:4]} {number[4:]}")
+    return phones
+
+def faker_phone_integers(n, locale, code):
+    msisdn = get_locale_faker(locale).msisdn
+    calling_code = LOCALE_CALLING_CODES[code][1:]
+    return [int(calling_code + msisdn()[3:13]) for _ in range(n)]
+
+def faker_dates_iso(n):
+    fake = default_context.fake
+    return [fake.date_of_birth(minimum_age=18, maximum_age=65).isoformat() for _ in range(n)]
+
+## Per-value cost (ns) of the Faker implementations vs the lookup-table generators that schemas run ##
+def bench_lookup_tables(count=20000, locale=("en_GB", "GB")):
+    cases = (
+        ("phone_number", lambda n: faker_phone_strings(n, *locale), lambda n: localized_batch_data_types["phone_number"](n, *locale)),
+        ("phone_number_int", lambda n: faker_phone_integers(n, *locale), lambda n: localized_batch_data_types["phone_number_int"](n, *locale)),
+        ("date_iso", faker_dates_iso, batch_data_types["date_iso"]),
+    )
+    results = {}
+    for dtype, faker_batch, table_batch in cases:
+        faker_batch(1)  ## Build Faker and the tables outside the timing ##
+        table_batch(1)
+        results[f"lookup.{dtype}.faker.ns_per_value"] = best_time(lambda: faker_batch(count)) / count * 1e9
+        results[f"lookup.{dtype}.table.ns_per_value"] = best_time(lambda: table_batch(count)) / count * 1e9
+    return results
+
+## Name -> benchmark function ##
+benchmarks = {
+    "data_types": bench_data_types,
+    "scaling": bench_generate_scaling,
+    "memory": bench_memory,
+    "api": bench_api,
+    "json": bench_json_backends,
+    "startup": bench_startup,
+    "compression": bench_compression,
+    "lookup": bench_lookup_tables,
+}
+
+def higher_is_better(metric):
+    return metric.endswith("_per_sec")
+
+## Compare results with a baseline; returns a list of regressions beyond threshold (0.2 = 20%) ##
+def find_regressions(results, baseline, threshold):
+    regressions = []
+    for metric, value in results.items():
+        base = baseline.get(metric)
+        if not base:
+            continue
+        change = (base - value) / base if higher_is_better(metric) else (value - base) / base
+        if change > threshold:
+            regressions.append((metric, base, value, change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Random Data Generator benchmarks")
+    parser.add_argument("names", nargs="*", default=list(benchmarks), help=f"benchmarks to run: {', '.join(benchmarks)}")
+    parser.add_argument("--output", help="write results as JSON to this baseline file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed regression before --compare fails (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.names:
+        results.update(benchmarks[name]())
+    print(json.dumps(results, indent=2))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for metric, base, value, change in regressions:
+            print(f"REGRESSION {metric}: {base:.4g} -> {value:.4g} ({change:.0%} worse)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
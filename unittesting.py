@@ -1,10 +1,48 @@
 import pytest
+import json
+import os
+import subprocess
+import sys
+import gzip
+import io
+import RandomDataGenerator
+from datetime import date, timedelta
+from SchemaStore import SQLiteSchemaStore, MemorySchemaStore
+from ResponseCache import ResponseCache
+from OutputFormats import write_csv, write_json_rows
+from JsonSerializer import dumps_lines
+from benchmark import find_regressions
+from Metrics import MetricsRegistry, render_prometheus
+from Profiler import ProfileStore
+from Uniqueness import FeistelPermutation, ScalableBloomFilter
+from Compression import compress_stream, peek_stream
+from Relations import ParentKeyIndex, prepare_batch, iter_batch
+from ElasticShipper import BulkSender
 from RandomDataGenerator import (
     generate_global_phone_string,
     generate_global_phone_integer,
     generate_address_and_country,
     generate_data,
-    available_data_types
+    iter_data,
+    iter_columns,
+    available_data_types,
+    batch_data_types,
+    get_birth_date_window,
+    get_calling_code_table,
+    get_date_iso_table,
+    ValuePool,
+    get_locale_faker,
+    LOCALE_CALLING_CODES,
+    LOCALE_PHONE_PREFIXES,
+    compile_schema,
+    get_generation_timings,
+    check_unique_capacity,
+    export_data,
+    load_schema_file,
+    run_export,
+    warm_up,
+    display_data,
+    cli_output_formats
 )
 
 ## Test string based phone number format ##
@@ -73,3 +111,431 @@ def test_address_country_locale_integrity():
     result = generate_address_and_country()
     assert isinstance(result["Address"], str)
     assert len(result["Country Code"]) == 2
+
+## Test iter_data yields records lazily ##
+def test_iter_data_is_lazy():
+    records = iter_data({"ID": "id_number"}, 3)
+    first = next(records)
+    assert "ID" in first
+    assert len(list(records)) == 2
+
+## Test every data type has a batch generator producing a full column ##
+@pytest.mark.parametrize("field_type", list(available_data_types))
+def test_batch_generators_return_full_column(field_type):
+    column = batch_data_types[field_type](5)
+    assert len(column) == 5
+
+## Test columnar output mode ##
+def test_generate_data_columnar():
+    columns = generate_data({"ID": "id_number", "Active": "boolean"}, 4, columnar=True)
+    assert set(columns) == {"ID", "Active"}
+    assert len(columns["ID"]) == 4
+    assert all(1000 <= value <= 999999 for value in columns["ID"])
+    assert all(isinstance(value, bool) for value in columns["Active"])
+
+## Test batch date of birth stays within the 18-65 age window ##
+def test_batch_dates_within_window():
+    start, span = get_birth_date_window()
+    for value in batch_data_types["date_iso"](200):
+        assert start <= date.fromisoformat(value) <= start + timedelta(days=span)
+
+## Test the calling-code table keeps each code's formatted text and its digits-only prefix ##
+def test_calling_code_table_is_sanitized():
+    codes, prefixes = get_calling_code_table()
+    assert len(codes) == len(prefixes)
+    for code, prefix in zip(codes, prefixes):
+        assert prefix == int(code.replace("+", "").replace(" ", "")) * 10 ** 10
+
+## Test batch phone numbers carry a table calling code and ten local digits ##
+def test_batch_phone_formats():
+    codes, prefixes = get_calling_code_table()
+    for value in batch_data_types["phone_number"](200):
+        code, number = value[1:].split(") ")
+        assert code in codes
+        assert len(number.replace(" ", "")) == 10 and number[4] == " "
+    for value in batch_data_types["phone_number_int"](200):
+        assert value - value % 10 ** 10 in prefixes
+
+## Test phone fields in a schema (the localized path) use the record's prefix and ten local digits ##
+def test_schema_phone_fields_use_locale_prefixes():
+    fields = {"Country": "alpha2", "Phone": "phone_number", "PhoneInt": "phone_number_int"}
+    for record in generate_data(fields, 200, seed=4):
+        assert record["PhoneInt"] - record["PhoneInt"] % 10 ** 10 == LOCALE_PHONE_PREFIXES[record["Country"]]
+        code, number = record["Phone"][1:].split(") ")
+        assert code == LOCALE_CALLING_CODES[record["Country"]]
+        assert len(number) == 11 and number[4] == " " and number.replace(" ", "").isdigit()
+
+## Test the date of birth table covers today's window and is built once per day ##
+def test_date_iso_table_is_cached():
+    start, span = get_birth_date_window()
+    table = get_date_iso_table()
+    assert table is get_date_iso_table()
+    assert len(table) == span + 1
+    assert table[0] == start.isoformat() and table[-1] == (start + timedelta(days=span)).isoformat()
+
+## Test a value pool misses while cold, then serves hits once filled ##
+def test_value_pool_hits_and_misses():
+    pool = ValuePool(lambda n: list(range(n)), size=10)
+    assert len(pool.sample(3)) == 3
+    pool.refill()
+    assert pool.is_warm()
+    assert all(0 <= value < 10 for value in pool.sample(5))
+    assert pool.stats()["hits"] == 5
+    assert pool.stats()["misses"] == 3
+
+## Test fifo eviction replaces the oldest slots first ##
+def test_value_pool_fifo_refresh():
+    pool = ValuePool(lambda n: ["new"] * n, size=10, refresh_fraction=0.3, eviction="fifo")
+    pool.values = ["old"] * 10
+    pool.sample(5)
+    pool.refill()
+    assert pool.values[:3] == ["new"] * 3
+    assert pool.values[3:] == ["old"] * 7
+
+## Test a warm pool only refreshes as many values as were sampled, and nothing while idle ##
+def test_value_pool_refresh_follows_consumption():
+    generated = []
+    pool = ValuePool(lambda n: generated.append(n) or ["new"] * n, size=10, refresh_fraction=0.5)
+    pool.values = ["old"] * 10
+    pool.refill()
+    assert generated == []
+    pool.sample(2)
+    pool.refill()
+    assert generated == [2]
+    pool.refill()
+    assert generated == [2]
+
+## Test each locale's Faker is built once and reused ##
+def test_locale_faker_is_cached():
+    assert get_locale_faker("fr_FR") is get_locale_faker("fr_FR")
+
+## Test country code and phone calling code agree within each record ##
+def test_record_locale_consistency():
+    fields = {"Country": "alpha2", "Phone": "phone_number_int", "Address": "full_address", "Name": "full_name"}
+    for record in generate_data(fields, 50):
+        calling_code = LOCALE_CALLING_CODES[record["Country"]][1:]
+        assert str(record["Phone"]).startswith(calling_code)
+        assert isinstance(record["Address"], str) and isinstance(record["Name"], str)
+
+## Test compile_schema resolves each field once into an immutable plan ##
+def test_compile_schema_plan():
+    plan = compile_schema({"Name": "full_name", "ID": "id_number"})
+    assert plan.keys == ("Name", "ID")
+    assert [field.strategy for field in plan.fields] == ["localized", "batch"]
+    data = generate_data(plan, 2)
+    assert len(data) == 2 and set(data[0]) == {"Name", "ID"}
+
+## Test strict compilation rejects unknown data types up front ##
+def test_compile_schema_strict_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        compile_schema({"UnknownField": "not_real_type"}, strict=True)
+
+## Test seeded generation is reproducible and independent of how the range is chunked ##
+def test_seeded_generation_is_chunk_independent():
+    fields = {field_type: field_type for field_type in available_data_types}
+    full = generate_data(fields, 1500, seed=42)
+    chunks = generate_data(fields, 700, seed=42) + list(iter_data(fields, 800, seed=42, offset=700))
+    assert full == chunks
+    assert generate_data(fields, 1, seed=42, offset=1234) == [full[1234]]
+
+## Test different seeds produce different data ##
+def test_different_seeds_differ():
+    fields = {"Name": "full_name", "ID": "id_number"}
+    assert generate_data(fields, 5, seed=1) != generate_data(fields, 5, seed=2)
+
+## Test the process-pool backend matches a single-process seeded run ##
+def test_parallel_generation_matches_serial(monkeypatch):
+    monkeypatch.setattr(RandomDataGenerator, "PARALLEL_THRESHOLD", 10)
+    monkeypatch.setattr(RandomDataGenerator, "PARALLEL_CHUNK_SIZE", 1000)
+    fields = {"Name": "full_name", "ID": "id_number", "Genre": "music_genre"}
+    parallel = generate_data(fields, 2500, seed=9, workers=2)
+    assert parallel == generate_data(fields, 2500, seed=9)
+
+## Test two SQLite store instances (as in two gunicorn workers) see each other's schemas ##
+def test_sqlite_schema_store_shared(tmp_path):
+    path = str(tmp_path / "schemas.db")
+    worker_a = SQLiteSchemaStore(path, compile_schema)
+    worker_b = SQLiteSchemaStore(path, compile_schema)
+    worker_a.put("people", {"Name": "full_name"}, 2)
+    assert worker_b.get("people")["count"] == 2
+    worker_a.put("people", {"ID": "id_number"}, 5)
+    entry = worker_b.get("people")
+    assert entry["count"] == 5 and entry["plan"].keys == ("ID",)
+    assert worker_b.names() == ["people"]
+    assert worker_b.get("missing") is None
+
+## Test schema digests follow content, not the version counter that restarts with each store ##
+def test_schema_digest_survives_store_restart(tmp_path):
+    first, second = MemorySchemaStore(compile_schema), MemorySchemaStore(compile_schema)
+    first.put("s", {"Name": "full_name"}, 2)
+    second.put("s", {"ID": "id_number"}, 2)
+    assert first.get("s")["version"] == second.get("s")["version"]
+    assert first.get("s")["digest"] != second.get("s")["digest"]
+    sqlite_store = SQLiteSchemaStore(str(tmp_path / "schemas.db"), compile_schema)
+    sqlite_store.put("s", {"Name": "full_name"}, 2)
+    assert sqlite_store.get("s")["digest"] == first.get("s")["digest"]
+
+## Test the response cache evicts least recently used entries once over its byte budget ##
+def test_response_cache_lru_eviction():
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.get("a") == b"12345"
+    cache.put("c", b"12345")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"12345" and cache.get("c") == b"12345"
+    assert cache.stats()["bytes_held"] == 10
+
+## Test capture stores a streamed body only after it completes ##
+def test_response_cache_capture():
+    cache = ResponseCache(max_bytes=100)
+    stream = cache.capture("k", iter(["[", "1", "]"]))
+    assert next(stream) == b"["
+    assert cache.get("k") is None
+    assert b"".join(stream) == b"1]"
+    assert cache.get("k") == b"[1]"
+
+## Test CSV output writes the header once followed by every record ##
+def test_csv_output_header_once():
+    plan = compile_schema({"ID": "id_number", "Active": "boolean"})
+    text = "".join(write_csv(iter_columns(plan, 1500, seed=3), plan.keys))
+    lines = text.strip().splitlines()
+    assert lines[0] == "ID,Active"
+    assert len(lines) == 1501
+
+## Test compact JSON rows output matches the record output ##
+def test_json_rows_output_matches_records():
+    plan = compile_schema({"ID": "id_number", "Name": "full_name"})
+    compact = json.loads(b"".join(write_json_rows(iter_columns(plan, 20, seed=5), plan.keys)))
+    records = generate_data(plan, 20, seed=5)
+    assert compact["fields"] == ["ID", "Name"]
+    assert [dict(zip(compact["fields"], row)) for row in compact["rows"]] == records
+
+## Test the serializer's NDJSON writer round-trips through the stdlib decoder ##
+def test_serializer_dumps_lines_round_trip():
+    records = generate_data({"Name": "full_name", "ID": "id_number", "Active": "boolean"}, 5)
+    lines = dumps_lines(records).decode().splitlines()
+    assert [json.loads(line) for line in lines] == records
+
+## Test benchmark comparison flags drops in throughput and rises in latency beyond the threshold ##
+def test_benchmark_find_regressions():
+    baseline = {"a.records_per_sec": 100.0, "b.p50_ms": 10.0, "c.peak_bytes": 1000, "d.records_per_sec": 100.0}
+    results = {"a.records_per_sec": 70.0, "b.p50_ms": 11.0, "c.peak_bytes": 1500, "d.records_per_sec": 150.0, "new.p50_ms": 5.0}
+    regressions = find_regressions(results, baseline, threshold=0.2)
+    assert [metric for metric, _, _, _ in regressions] == ["a.records_per_sec", "c.peak_bytes"]
+
+## Test generation timings count one call per column batch and every value generated ##
+def test_generation_timings_per_data_type():
+    before = get_generation_timings().get("boolean", [0, 0, 0.0])
+    generate_data({"Active": "boolean"}, 2500)
+    after = get_generation_timings()["boolean"]
+    assert after[0] - before[0] == 3
+    assert after[1] - before[1] == 2500
+
+## Test metrics from every worker's file are summed into one exposition ##
+def test_metrics_aggregate_across_workers(tmp_path):
+    registry = MetricsRegistry(lambda: {"boolean": [1, 10, 0.5]}, directory=str(tmp_path))
+    registry.add_records("/schemas/<name>/data", 10)
+    (tmp_path / "metrics_99999.json").write_text(json.dumps({
+        'rdg_records_served_total{endpoint="/schemas/<name>/data"}': 5,
+        'rdg_generation_values_total{data_type="boolean"}': 20
+    }))
+    text = render_prometheus(registry.collect(), {"rdg_schemas": 2})
+    assert 'rdg_records_served_total{endpoint="/schemas/<name>/data"} 15' in text
+    assert 'rdg_generation_values_total{data_type="boolean"} 30' in text
+    assert "# TYPE rdg_schemas gauge" in text
+
+## Test a worker that reuses a dead worker's pid adds to its totals instead of overwriting them ##
+def test_metrics_reused_pid_keeps_dead_worker_totals(tmp_path):
+    dead = MetricsRegistry(lambda: {}, directory=str(tmp_path))
+    dead.add_records("/schemas/<name>/data", 7)
+    dead.maybe_flush(force=True)
+    recycled = MetricsRegistry(lambda: {}, directory=str(tmp_path))
+    recycled.add_records("/schemas/<name>/data", 1)
+    assert recycled.collect()['rdg_records_served_total{endpoint="/schemas/<name>/data"}'] == 8
+
+## Test files of exited workers are folded into one file, keeping every count ##
+def test_metrics_fold_exited_workers(tmp_path):
+    exited_pid = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited_pid.wait()
+    sample = 'rdg_records_served_total{endpoint="/schemas/<name>/data"}'
+    for token, count in (("aaaa", 3), ("bbbb", 4)):
+        (tmp_path / f"metrics_{exited_pid.pid}_{token}.json").write_text(json.dumps({sample: count}))
+    registry = MetricsRegistry(lambda: {}, directory=str(tmp_path))
+    registry.add_records("/schemas/<name>/data", 1)
+    assert registry.collect()[sample] == 8
+    assert registry.collect()[sample] == 8
+    assert sorted(path.name for path in tmp_path.glob("metrics_*.json")) == sorted(
+        ["metrics_exited.json", os.path.basename(registry.path_for(os.getpid()))]
+    )
+
+## Test the profile store keeps only the slowest profiles, each with hotspots ##
+def test_profile_store_keeps_slowest():
+    store = ProfileStore(keep=2, top=5)
+    for count in (100, 50000, 10000):
+        result, report = store.run(lambda: generate_data({"ID": "id_number"}, count), records=count)
+        assert len(result) == count
+        assert 0 < len(report["hotspots"]) <= 5
+    assert [summary["records"] for summary in store.summaries()] == [50000, 10000]
+
+## Test importing the generator loads neither Faker nor colorama until they are needed ##
+def test_import_is_lazy():
+    code = "import sys, RandomDataGenerator; print('faker' in sys.modules, 'colorama' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["False", "False"]
+
+## Test the Feistel permutation visits every index exactly once ##
+def test_feistel_permutation_is_bijective():
+    permutation = FeistelPermutation(1000, key=42)
+    assert sorted(permutation[i] for i in range(1000)) == list(range(1000))
+
+## Test the scalable Bloom filter never accepts a value twice, even after growing ##
+def test_bloom_filter_rejects_repeats():
+    seen = ScalableBloomFilter(initial_capacity=100)
+    assert all(seen.add(f"value{i}") for i in range(50))
+    assert not any(seen.add(f"value{i}") for i in range(50))
+    for i in range(50, 1000):
+        seen.add(f"value{i}")
+    assert len(seen.filters) > 1
+    assert not any(seen.add(f"value{i}") for i in range(1000))
+
+## Test unique fields have no repeats and seeded pages still match the full dataset ##
+def test_unique_fields_seeded_pages():
+    fields = {"ID": {"type": "id_number", "unique": True}, "Name": {"type": "full_name", "unique": True}}
+    records = generate_data(fields, 2500, seed=8)
+    assert len({record["ID"] for record in records}) == 2500
+    assert len({record["Name"] for record in records}) == 2500
+    assert generate_data(fields, 700, seed=8, offset=1500) == records[1500:2200]
+
+## Test unique capacity errors are raised before anything is generated ##
+def test_unique_capacity_and_unsupported_types():
+    with pytest.raises(ValueError, match="only has 2 distinct values"):
+        check_unique_capacity(compile_schema({"Active": {"type": "boolean", "unique": True}}), 3)
+    with pytest.raises(ValueError, match="cannot be unique"):
+        compile_schema({"Country": {"type": "alpha2", "unique": True}})
+    assert sorted(generate_data({"Active": {"type": "boolean", "unique": True}}, 2), key=str) == [{"Active": False}, {"Active": True}]
+
+## Test the export streams a seeded dataset through gzip unchanged ##
+def test_export_data_gzip_matches_generate_data():
+    fields = {"ID": "id_number", "Name": "full_name"}
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb") as out:
+        records, _ = export_data(fields, 2500, out, "ndjson", seed=12)
+    assert records == 2500
+    lines = gzip.decompress(buffer.getvalue()).decode().splitlines()
+    assert [json.loads(line) for line in lines] == generate_data(fields, 2500, seed=12)
+
+## Test schema files may be a bare fields dict or a /schemas request body ##
+def test_load_schema_file(tmp_path):
+    body = tmp_path / "body.json"
+    body.write_text(json.dumps({"name": "people", "fields": {"Name": "full_name"}, "count": 40}))
+    bare = tmp_path / "bare.json"
+    bare.write_text(json.dumps({"Name": "full_name"}))
+    assert load_schema_file(str(body)) == ({"Name": "full_name"}, 40)
+    assert load_schema_file(str(bare)) == ({"Name": "full_name"}, None)
+
+## Test the export rejects a negative offset, no workers and a schema file that is not an object ##
+@pytest.mark.parametrize("args, content", [
+    (["--offset", "-1"], {"ID": {"type": "id_number", "unique": True}}),
+    (["--workers", "0"], {"ID": "id_number"}),
+    ([], [1, 2]),
+])
+def test_run_export_rejects_bad_input(tmp_path, capsys, args, content):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps(content))
+    with pytest.raises(SystemExit) as exit_info:
+        run_export(["--schema", str(schema), "--count", "5", "--seed", "1", "--output", str(tmp_path / "out.ndjson")] + args)
+    assert exit_info.value.code == 2
+    assert "error:" in capsys.readouterr().err
+
+## Test streamed gzip output decodes to the original chunks ##
+def test_compress_stream_gzip_round_trip():
+    chunks = [b"[", b'{"a":1}', b",", b'{"a":2}', b"]"]
+    assert gzip.decompress(b"".join(compress_stream(iter(chunks), "gzip"))) == b"".join(chunks)
+
+## Test peeking stops once the threshold is buffered and reports short streams ##
+def test_peek_stream_threshold():
+    head, rest, ended = peek_stream(iter([b"aaaa", "bbbb", b"cccc"]), 6)
+    assert head == [b"aaaa", b"bbbb"] and not ended
+    assert list(rest) == [b"cccc"]
+    head, _, ended = peek_stream(iter([b"aa"]), 6)
+    assert head == [b"aa"] and ended
+
+## Test batches order parents first and child foreign keys only use generated parent keys ##
+def test_batch_foreign_keys_sample_parent_keys():
+    customers = compile_schema({"CustomerId": {"type": "id_number", "unique": True}})
+    orders = compile_schema({"CustomerId": {"type": "foreign_key", "schema": "customers", "field": "CustomerId"}})
+    entries = prepare_batch([("orders", orders, 3000), ("customers", customers, 1500)])
+    assert [name for name, _, _ in entries] == ["customers", "orders"]
+    generated = {}
+    for name, plan, batches in iter_batch(entries, seed=2):
+        generated[name] = [value for _, columns in batches for value in columns["CustomerId"]]
+    assert len(generated["orders"]) == 3000
+    assert set(generated["orders"]) <= set(generated["customers"])
+
+## Test batches reject foreign keys to schemas outside the batch and cycles ##
+def test_batch_rejects_missing_parents_and_cycles():
+    child = compile_schema({"ParentId": {"type": "foreign_key", "schema": "parent", "field": "Id"}})
+    with pytest.raises(ValueError, match="not in this batch"):
+        prepare_batch([("child", child, 10)])
+    a = compile_schema({"Id": "id_number", "B": {"type": "foreign_key", "schema": "b", "field": "Id"}})
+    b = compile_schema({"Id": "id_number", "A": {"type": "foreign_key", "schema": "a", "field": "Id"}})
+    with pytest.raises(ValueError, match="cycle"):
+        prepare_batch([("a", a, 10), ("b", b, 10)])
+
+## Test the parent key index stays packed for integers and falls back to a list for strings ##
+def test_parent_key_index_packing():
+    index = ParentKeyIndex()
+    index.extend([1, 2, 3])
+    assert index.keys.typecode == "q"
+    index.extend(["a", "b"])
+    assert list(index.keys) == [1, 2, 3, "a", "b"]
+
+## Test a 2xx _bulk reply that is not JSON is retried instead of crashing the shipper ##
+def test_bulk_sender_retries_non_json_reply():
+    class Reply:
+        def __init__(self, status_code, text):
+            self.status_code = status_code
+            self.text = text
+
+        def json(self):
+            return json.loads(self.text)
+
+    class Session:
+        def __init__(self, replies):
+            self.replies = replies
+
+        def post(self, url, **kwargs):
+            return self.replies.pop(0)
+
+    ok = json.dumps({"errors": False, "items": [{"index": {"status": 201}}]})
+    sender = BulkSender(Session([Reply(200, "<html>proxy</html>"), Reply(200, ok)]), "http://es", {}, 10, backoff=0)
+    stats = sender.send([b'{"index":{}}\n{"a":1}\n'])
+    assert stats["indexed"] == 1 and stats["retried"] == 1 and stats["dropped"] == 0
+
+## Test every CLI output format can be displayed, whether its writer yields str or bytes ##
+@pytest.mark.parametrize("fmt", list(cli_output_formats.values()))
+def test_display_data_every_cli_format(fmt, capsysbinary):
+    display_data(generate_data({"ID": "id_number", "Name": "full_name"}, 3), fmt)
+    assert b"Generated Data" in capsysbinary.readouterr().out
+
+## Test workers forked after warm_up (gunicorn --preload) generate different unseeded values ##
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_workers_after_warm_up_differ():
+    warm_up()
+    fields = {"Name": "full_name", "Email": "email_address", "Address": "full_address", "Country": "alpha2"}
+    outputs = []
+    for _ in range(2):
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            os.write(write_end, json.dumps(generate_data(fields, 5)).encode())
+            os._exit(0)
+        os.close(write_end)
+        with os.fdopen(read_end, "rb") as pipe:
+            outputs.append(json.loads(pipe.read()))
+        os.waitpid(pid, 0)
+    first, second = outputs
+    assert [record["Email"] for record in first] != [record["Email"] for record in second]
+    assert [record["Name"] for record in first] != [record["Name"] for record in second]